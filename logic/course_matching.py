@@ -12,6 +12,11 @@ import pandas as pd
 import os
 import streamlit as st
 from database.connection import db_cursor
+from logic.prerequisites import (
+    get_eligible_courses,
+    get_major_courses,
+    load_prerequisites,
+)
 
 # Load requirements CSV with course codes, major columns, and course titles
 REQUIREMENTS_FILE = "curriculum_requirements2.csv"
@@ -38,7 +43,6 @@ def load_prerequisites_data():
 
     CACHED: This function reads from disk only once per hour.
     """
-    from logic.prerequisites import load_prerequisites
     return load_prerequisites()
 
 
@@ -287,19 +291,18 @@ def get_student_requirements_fast(student_id: str, major_code: str,
     if major_prefix not in available_majors:
         return []
 
-    # Get courses where this major column has 'X'
-    major_reqs = requirements_df[requirements_df[major_prefix] == 'X']
-    required_codes = major_reqs['course_code'].tolist()
+    # Get courses where this major column has 'X' (indexed once per DataFrame)
+    required_codes = get_major_courses(requirements_df, major_prefix)
 
-    # Get courses this student has taken from pre-fetched data
-    taken_courses = transcripts.get(student_id, [])
+    # Get courses this student has taken from pre-fetched data, as a set for
+    # O(1) membership checks
+    taken_courses = frozenset(transcripts.get(student_id, ()))
 
     # Find missing courses
     missing_courses = [code for code in required_codes if code not in taken_courses]
 
     # Apply prerequisite filtering if available
     if prereq_data:
-        from logic.prerequisites import get_eligible_courses
         missing_courses = get_eligible_courses(taken_courses, missing_courses, prereq_data)
 
     return missing_courses
@@ -449,6 +452,10 @@ def generate_needs_matrix(students_df: pd.DataFrame, progress_callback=None):
     all_needs = []
     total_students = len(students_df)
 
+    # Students with the same major and the same transcript need the same
+    # courses, so compute each (major, courses taken) combination only once
+    requirements_memo = {}
+
     for i, (_, student) in enumerate(students_df.iterrows()):
         student_id = student["StudentId"]
         student_name = student["Name"]
@@ -458,9 +465,13 @@ def generate_needs_matrix(students_df: pd.DataFrame, progress_callback=None):
             progress_callback(i + 1, total_students, student_name)
 
         # Use fast version with pre-loaded data and prerequisite filtering
-        missing_courses = get_student_requirements_fast(
-            student_id, major_code, requirements_df, transcripts, prereq_data
-        )
+        memo_key = (major_code, frozenset(transcripts.get(student_id, ())))
+        missing_courses = requirements_memo.get(memo_key)
+        if missing_courses is None:
+            missing_courses = get_student_requirements_fast(
+                student_id, major_code, requirements_df, transcripts, prereq_data
+            )
+            requirements_memo[memo_key] = missing_courses
 
         student_data = {
             "StudentId": student_id,
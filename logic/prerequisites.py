@@ -13,10 +13,18 @@ Key concepts:
 
 import pandas as pd
 import os
+import sys
+import weakref
 from collections import defaultdict
 
 PREREQUISITES_FILE = "pre-requisites.csv"
 
+# Major columns in the requirements CSV
+MAJOR_COLUMNS = ('BAD', 'THM', 'FIN', 'TES', 'INT')
+
+# (weak reference to requirements DataFrame, its major index); see get_major_courses
+_major_index_cache = (None, {})
+
 
 def load_prerequisites() -> dict:
     """
@@ -24,28 +32,45 @@ def load_prerequisites() -> dict:
 
     Returns:
         dict: {
-            'chains': {chain_id: [(order, course_code), ...]},
-            'course_to_chains': {course_code: [(chain_id, order), ...]}
+            'chains': {chain_id: ((order, course_code), ...)},
+            'course_to_chains': {course_code: ((chain_id, order), ...)},
+            'chain_orders': {chain_id: {course_code: order, ...}},
+            'course_prereqs': {course_code: (frozenset(prior courses), ...)}
         }
 
+        Course codes and chain IDs are interned, so the membership checks in
+        the eligibility functions mostly hit CPython's identity fast path.
+        course_prereqs holds one set per distinct prerequisite set, so a
+        course that starts several chains (e.g. ARIL-210) has a single check.
+
     Example structure:
         {
             'chains': {
-                'a': [(1, 'ACCT-310'), (2, 'ACCT-312'), (3, 'ACCT-313'), (4, 'ACCT-300')],
-                'b': [(1, 'ARIL-210'), (2, 'ENGL-201A'), (3, 'ENGL-302A')],
+                'a': ((1, 'ACCT-310'), (2, 'ACCT-312'), (3, 'ACCT-313'), (4, 'ACCT-300')),
+                'b': ((1, 'ARIL-210'), (2, 'ENGL-201A'), (3, 'ENGL-302A')),
                 ...
             },
             'course_to_chains': {
-                'ACCT-310': [('a', 1)],
-                'ARIL-210': [('b', 1), ('c', 1), ('d', 1), ('e', 1)],
-                'STAT-105': [('m', 2)],
-                'THM-331': [('n', 2)],
+                'ACCT-310': (('a', 1),),
+                'ARIL-210': (('b', 1), ('c', 1), ('d', 1), ('e', 1)),
+                'STAT-105': (('m', 2),),
+                'THM-331': (('n', 2),),
+                ...
+            },
+            'chain_orders': {
+                'a': {'ACCT-310': 1, 'ACCT-312': 2, 'ACCT-313': 3, 'ACCT-300': 4},
+                ...
+            },
+            'course_prereqs': {
+                'ACCT-312': (frozenset({'ACCT-310'}),),
+                'ENGL-201A': (frozenset({'ARIL-210'}),),
+                'ARIL-210': (frozenset(),),
                 ...
             }
         }
     """
     if not os.path.exists(PREREQUISITES_FILE):
-        return {'chains': {}, 'course_to_chains': {}}
+        return {'chains': {}, 'course_to_chains': {}, 'chain_orders': {}, 'course_prereqs': {}}
 
     try:
         df = pd.read_csv(PREREQUISITES_FILE)
@@ -54,9 +79,9 @@ def load_prerequisites() -> dict:
         course_to_chains = defaultdict(list)
 
         for _, row in df.iterrows():
-            chain_id = str(row['ChainID']).strip()
+            chain_id = sys.intern(str(row['ChainID']).strip())
             order_str = str(row['Order']).strip()
-            course_code = str(row['CourseCode']).strip()
+            course_code = sys.intern(str(row['CourseCode']).strip())
 
             # Skip empty rows
             if not chain_id or not order_str or not course_code:
@@ -75,18 +100,47 @@ def load_prerequisites() -> dict:
             # Map course to its chains
             course_to_chains[course_code].append((chain_id, order))
 
-        # Sort each chain by order
-        for chain_id in chains:
-            chains[chain_id] = sorted(chains[chain_id], key=lambda x: x[0])
+        # Sort each chain by order; tuples keep the loaded data compact and read-only
+        sorted_chains = {
+            chain_id: tuple(sorted(chain, key=lambda x: x[0]))
+            for chain_id, chain in chains.items()
+        }
 
         return {
-            'chains': dict(chains),
-            'course_to_chains': dict(course_to_chains)
+            'chains': sorted_chains,
+            'course_to_chains': {
+                course_code: tuple(entries)
+                for course_code, entries in course_to_chains.items()
+            },
+            'chain_orders': {
+                chain_id: _index_chain(chain)
+                for chain_id, chain in sorted_chains.items()
+            },
+            'course_prereqs': {
+                course_code: tuple(dict.fromkeys(
+                    _prior_courses(sorted_chains[chain_id], order)
+                    for chain_id, order in entries
+                ))
+                for course_code, entries in course_to_chains.items()
+            }
         }
 
     except Exception as e:
         print(f"Error loading prerequisites: {e}")
-        return {'chains': {}, 'course_to_chains': {}}
+        return {'chains': {}, 'course_to_chains': {}, 'chain_orders': {}, 'course_prereqs': {}}
+
+
+def _index_chain(chain) -> dict:
+    """
+    Map each course in a chain to its order.
+    Chains are sorted by order, so a repeated course keeps its highest order.
+    """
+    return {course_code: order for order, course_code in chain}
+
+
+def _prior_courses(chain, course_order: int) -> frozenset:
+    """Courses that come before ``course_order`` in a chain."""
+    return frozenset(course_code for order, course_code in chain if order < course_order)
 
 
 def get_chain_progress(chain_id: str, student_courses_taken: list, prereq_data: dict) -> int:
@@ -101,16 +155,39 @@ def get_chain_progress(chain_id: str, student_courses_taken: list, prereq_data:
     Returns:
         int: Highest order completed (0 if none taken)
     """
-    chain = prereq_data['chains'].get(chain_id, [])
-    if not chain:
+    chain_orders = prereq_data.get('chain_orders')
+    if chain_orders is not None:
+        orders = chain_orders.get(chain_id)
+    else:
+        # Hand-built data without the index; build it for this chain
+        orders = _index_chain(prereq_data.get('chains', {}).get(chain_id, ()))
+
+    if not orders:
         return 0
 
-    max_completed = 0
-    for order, course_code in chain:
-        if course_code in student_courses_taken:
-            max_completed = max(max_completed, order)
+    return max((orders.get(course, 0) for course in student_courses_taken), default=0)
 
-    return max_completed
+
+def _progress_by_chain(student_courses_taken, course_to_chains: dict) -> dict:
+    """
+    Get the highest order completed in every chain the student has started.
+    Walks the student's courses once instead of scanning each chain.
+    """
+    progress = {}
+    for course in student_courses_taken:
+        for chain_id, order in course_to_chains.get(course, ()):
+            if order > progress.get(chain_id, 0):
+                progress[chain_id] = order
+    return progress
+
+
+def _is_next(course_code: str, progress: dict, course_to_chains: dict) -> bool:
+    """Check a course against precomputed chain progress (see is_next_in_chain)."""
+    entries = course_to_chains.get(course_code)
+    if entries is None:
+        return True
+
+    return any(order == progress.get(chain_id, 0) + 1 for chain_id, order in entries)
 
 
 def is_course_eligible(course_code: str, student_courses_taken: list, prereq_data: dict) -> bool:
@@ -131,34 +208,27 @@ def is_course_eligible(course_code: str, student_courses_taken: list, prereq_dat
         bool: True if student is eligible, False otherwise
     """
     course_to_chains = prereq_data.get('course_to_chains', {})
-    chains = prereq_data.get('chains', {})
 
     # If course is not in any chain, it has no prerequisites
     if course_code not in course_to_chains:
         return True
 
-    # Check each chain this course belongs to
-    for chain_id, course_order in course_to_chains[course_code]:
-        chain = chains.get(chain_id, [])
-
-        # If this is the first course in the chain (order=1), it's always eligible
-        if course_order == 1:
-            return True
-
-        # Check if student has completed all prior courses in this chain
-        all_prior_completed = True
-        for order, prereq_course in chain:
-            if order < course_order:
-                if prereq_course not in student_courses_taken:
-                    all_prior_completed = False
-                    break
-
-        # If all prior courses in THIS chain are completed, course is eligible
-        if all_prior_completed:
-            return True
+    # One set of prior courses per chain containing this course
+    course_prereqs = prereq_data.get('course_prereqs')
+    if course_prereqs is not None:
+        prereq_sets = course_prereqs[course_code]
+    else:
+        # Hand-built data without the precomputed sets; derive them here
+        chains = prereq_data.get('chains', {})
+        prereq_sets = [
+            _prior_courses(chains.get(chain_id, ()), course_order)
+            for chain_id, course_order in course_to_chains[course_code]
+        ]
 
-    # No chain allows this course yet
-    return False
+    # Eligible if ALL prior courses of at least ONE chain are completed.
+    # The first course of a chain has no prior courses, so it always passes.
+    taken = frozenset(student_courses_taken)
+    return any(prereqs <= taken for prereqs in prereq_sets)
 
 
 def is_next_in_chain(course_code: str, student_courses_taken: list, prereq_data: dict) -> bool:
@@ -177,28 +247,15 @@ def is_next_in_chain(course_code: str, student_courses_taken: list, prereq_data:
         bool: True if course is the next one in at least one chain
     """
     course_to_chains = prereq_data.get('course_to_chains', {})
-    chains = prereq_data.get('chains', {})
 
     # If course is not in any chain, it's always available
     if course_code not in course_to_chains:
         return True
 
-    # Check each chain this course belongs to
-    for chain_id, course_order in course_to_chains[course_code]:
-        chain = chains.get(chain_id, [])
-
-        # Get the highest order the student has completed in this chain
-        max_completed = 0
-        for order, chain_course in chain:
-            if chain_course in student_courses_taken:
-                max_completed = max(max_completed, order)
-
-        # This course is "next" if its order is exactly max_completed + 1
-        if course_order == max_completed + 1:
-            return True
-
-    # Not the next course in any chain
-    return False
+    # This course is "next" if, in at least one of its chains, its order is
+    # exactly one past the highest order the student has completed there
+    progress = _progress_by_chain(student_courses_taken, course_to_chains)
+    return _is_next(course_code, progress, course_to_chains)
 
 
 def get_eligible_courses(student_courses_taken: list, all_required_courses: list,
@@ -211,6 +268,8 @@ def get_eligible_courses(student_courses_taken: list, all_required_courses: list
     - If a course is in a chain, only show it if:
       1. It's the next course in at least one chain (student has completed all prior)
       2. Student hasn't already taken it
+    - Input order is kept, and so are duplicates: a course listed twice and
+      eligible appears twice in the result
 
     Args:
         student_courses_taken: List of course codes the student has completed
@@ -224,18 +283,47 @@ def get_eligible_courses(student_courses_taken: list, all_required_courses: list
         # If no prerequisite data, return all required courses
         return all_required_courses
 
-    eligible = []
+    # Build the taken set and per-chain progress once for the whole list
+    # (frozenset() of a frozenset returns it unchanged)
+    taken = frozenset(student_courses_taken)
+    course_to_chains = prereq_data.get('course_to_chains', {})
+    progress = _progress_by_chain(taken, course_to_chains)
+
+    # Keep courses not yet taken that are next in at least one chain
+    return [
+        course for course in all_required_courses
+        if course not in taken and _is_next(course, progress, course_to_chains)
+    ]
 
-    for course in all_required_courses:
-        # Skip if student already took this course
-        if course in student_courses_taken:
-            continue
 
-        # Check if course is the next one in at least one chain
-        if is_next_in_chain(course, student_courses_taken, prereq_data):
-            eligible.append(course)
+def build_major_index(requirements_df: pd.DataFrame) -> dict:
+    """
+    Map each major column to the course codes it requires ('X'), in file order.
+    """
+    codes = requirements_df['course_code']
+    return {
+        major: tuple(codes[requirements_df[major] == 'X'])
+        for major in MAJOR_COLUMNS
+        if major in requirements_df.columns
+    }
+
+
+def get_major_courses(requirements_df: pd.DataFrame, major_prefix: str) -> tuple:
+    """
+    Get the course codes a major requires.
 
-    return eligible
+    The index is built once per requirements DataFrame and reused while the
+    same DataFrame is passed in; a reloaded DataFrame gets a fresh index.
+    Treat the DataFrame as read-only once it has been indexed.
+    """
+    global _major_index_cache
+
+    df_ref, index = _major_index_cache
+    if df_ref is None or df_ref() is not requirements_df:
+        index = build_major_index(requirements_df)
+        _major_index_cache = (weakref.ref(requirements_df), index)
+
+    return index.get(major_prefix, ())
 
 
 def filter_student_requirements(student_id: str, major_code: str,
@@ -260,24 +348,25 @@ def filter_student_requirements(student_id: str, major_code: str,
     if requirements_df.empty:
         return []
 
+    # Convert once; everything below only does membership checks
+    taken = frozenset(student_courses_taken)
+
     # Extract major prefix
     major_prefix = major_code.split("-")[0] if "-" in major_code else major_code[:3]
 
     # Validate major exists
-    available_majors = ['BAD', 'THM', 'FIN', 'TES', 'INT']
-    if major_prefix not in available_majors:
+    if major_prefix not in MAJOR_COLUMNS:
         return []
 
-    # Get courses where this major column has 'X'
-    major_reqs = requirements_df[requirements_df[major_prefix] == 'X']
-    required_codes = major_reqs['course_code'].tolist()
-
-    # Find missing courses (not yet taken)
-    missing_courses = [code for code in required_codes if code not in student_courses_taken]
+    # Courses this major requires (column has 'X') that are not yet taken
+    missing_courses = [
+        code for code in get_major_courses(requirements_df, major_prefix)
+        if code not in taken
+    ]
 
     # Apply prerequisite filtering
     eligible_courses = get_eligible_courses(
-        student_courses_taken,
+        taken,
         missing_courses,
         prereq_data
     )
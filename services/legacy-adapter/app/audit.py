@@ -13,14 +13,21 @@ Audit logs are written as structured JSON for easy parsing and analysis.
 
 from __future__ import annotations
 
+import functools
 import hashlib
+import itertools
 import json
 import logging
+import queue
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from json.encoder import encode_basestring_ascii as _escape
+from logging.handlers import QueueHandler, QueueListener
+from typing import TYPE_CHECKING, Any
 
-from pydantic import BaseModel, Field
+if TYPE_CHECKING:
+    from collections.abc import Callable
 
 logger = logging.getLogger("audit")
 
@@ -61,83 +68,220 @@ class AuditOutcome(str, Enum):
     PARTIAL = "partial"  # Operation partially completed
 
 
-class AuditEvent(BaseModel):
+class _FrozenMetadata(dict):
+    """Read-only dict so one metadata instance can be shared between events.
+
+    Subclassing dict (rather than MappingProxyType) keeps it natively
+    JSON-serializable.
+    """
+
+    __slots__ = ()
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("Shared audit metadata is read-only")
+
+    # dict's typed signatures differ per method; any call is rejected anyway
+    __setitem__ = __delitem__ = __ior__ = _readonly  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _readonly  # type: ignore[assignment]
+
+
+@functools.lru_cache(maxsize=1024)
+def _endpoint_metadata(endpoint: str) -> dict[str, Any]:
+    """Return the shared metadata dict for a rate-limited endpoint path.
+
+    Endpoint paths repeat across events; per-event values such as student
+    IDs would only miss and fill the cache, so they get plain dicts.
+    """
+    return _FrozenMetadata({"endpoint": endpoint})
+
+
+@dataclass(slots=True, kw_only=True)
+class AuditEvent:
     """Structured audit event record.
 
-    This model captures all relevant information about an audited operation
+    This record captures all relevant information about an audited operation
     for compliance, security monitoring, and troubleshooting.
+
+    Events are only built by AuditLogger from values it already controls, so
+    this is a plain slotted dataclass rather than a validating pydantic model.
+
+    ``event_type`` and ``outcome`` accept either the enum member or its raw
+    string value: both enums subclass str, so encoding looks them up by
+    value and never goes through ``Enum.value``.
     """
 
     # Event identification
-    event_id: str = Field(..., description="Unique event identifier (UUID)")
-    event_type: AuditEventType = Field(..., description="Type of event")
-    timestamp: datetime = Field(
-        default_factory=datetime.utcnow, description="UTC timestamp"
-    )
+    event_id: str  # Unique event identifier
+    event_type: AuditEventType | str
+    timestamp: datetime = field(default_factory=datetime.utcnow)  # UTC
 
     # Actor context (who)
-    api_key_fingerprint: str | None = Field(
-        None, description="SHA256 fingerprint of API key (first 16 chars)"
-    )
-    client_ip: str | None = Field(None, description="Client IP address")
-    user_agent: str | None = Field(None, description="HTTP User-Agent header")
+    api_key_fingerprint: str | None = None  # 64-bit BLAKE2b fingerprint (16 hex)
+    client_ip: str | None = None
+    user_agent: str | None = None  # HTTP User-Agent header
 
     # Operation context (what)
-    entity_type: str | None = Field(
-        None, description="Type of entity (student, course, etc.)"
-    )
-    entity_id: int | None = Field(None, description="ID of affected entity")
-    operation: str | None = Field(
-        None, description="Operation performed (create, read, update, delete)"
-    )
+    entity_type: str | None = None  # student, course, etc.
+    entity_id: int | None = None
+    operation: str | None = None  # create, read, update, delete
 
     # Outcome context (result)
-    outcome: AuditOutcome = Field(..., description="Operation outcome")
-    outcome_reason: str | None = Field(
-        None, description="Reason for failure or additional context"
-    )
+    outcome: AuditOutcome | str
+    outcome_reason: str | None = None  # Reason for failure or additional context
 
     # Performance context
-    duration_ms: float | None = Field(
-        None, description="Operation duration in milliseconds"
-    )
+    duration_ms: float | None = None
 
     # Additional context
-    metadata: dict[str, Any] | None = Field(
-        None, description="Additional event-specific data"
-    )
+    metadata: dict[str, Any] | None = None  # Additional event-specific data
 
     def to_json(self) -> str:
         """Serialize audit event to JSON string.
 
+        All fields are JSON-native once the timestamp is ISO-formatted and
+        enums are reduced to their values, so no ``default`` fallback is
+        used; non-JSON metadata values raise instead of being str()-coerced.
+
         Returns:
             JSON string representation of audit event
+
+        Raises:
+            KeyError: If ``event_type`` or ``outcome`` is a raw string that
+                is not one of the enum values
+            TypeError: If metadata contains a value json cannot encode
         """
-        return json.dumps(
-            {
-                "event_id": self.event_id,
-                "event_type": self.event_type.value,
-                "timestamp": self.timestamp.isoformat(),
-                "actor": {
-                    "api_key_fingerprint": self.api_key_fingerprint,
-                    "client_ip": self.client_ip,
-                    "user_agent": self.user_agent,
-                },
-                "operation": {
-                    "entity_type": self.entity_type,
-                    "entity_id": self.entity_id,
-                    "action": self.operation,
-                },
-                "outcome": {
-                    "status": self.outcome.value,
-                    "reason": self.outcome_reason,
-                    "duration_ms": self.duration_ms,
-                },
-                "metadata": self.metadata or {},
-            },
-            default=str,  # Handle any non-serializable types
+        return _ENCODERS[self.event_type](self)
+
+
+def _json_str(value: str | None) -> str:
+    return "null" if value is None else _escape(value)
+
+
+def _json_num(value: float | None) -> str:
+    return "null" if value is None else json.dumps(value)
+
+
+def _build_encoder(event_type: AuditEventType) -> Callable[[AuditEvent], str]:
+    """Build the JSON encoder for one event type.
+
+    The event layout is fixed, so the keys and the event type are baked into
+    constant string fragments once; encoding an event only escapes its
+    values. Output is byte-identical to ``json.dumps`` of the nested dict.
+    """
+    head = f', "event_type": {_escape(event_type.value)}, "timestamp": "'
+
+    def encode(event: AuditEvent) -> str:
+        return (
+            '{"event_id": '
+            + _escape(event.event_id)
+            + head
+            + event.timestamp.isoformat()
+            + '", "actor": {"api_key_fingerprint": '
+            + _json_str(event.api_key_fingerprint)
+            + ', "client_ip": '
+            + _json_str(event.client_ip)
+            + ', "user_agent": '
+            + _json_str(event.user_agent)
+            + '}, "operation": {"entity_type": '
+            + _json_str(event.entity_type)
+            + ', "entity_id": '
+            + _json_num(event.entity_id)
+            + ', "action": '
+            + _json_str(event.operation)
+            + '}, "outcome": {"status": '
+            + _OUTCOME_JSON[event.outcome]
+            + ', "reason": '
+            + _json_str(event.outcome_reason)
+            + ', "duration_ms": '
+            + _json_num(event.duration_ms)
+            + '}, "metadata": '
+            + (json.dumps(event.metadata) if event.metadata else "{}")
+            + "}"
         )
 
+    return encode
+
+
+# Keyed by the raw string values; enum members hash and compare equal to them
+_OUTCOME_JSON: dict[str, str] = {
+    outcome.value: _escape(outcome.value) for outcome in AuditOutcome
+}
+_ENCODERS: dict[str, Callable[[AuditEvent], str]] = {
+    event_type.value: _build_encoder(event_type) for event_type in AuditEventType
+}
+
+
+def _encode_fallback(event: AuditEvent, error: Exception) -> str:
+    """Serialize an event the fast encoder rejected, so it is still written.
+
+    Used for an unknown raw ``event_type``/``outcome`` or non-JSON metadata.
+    Values json cannot encode are str()-coerced and the encoder error is
+    recorded in ``serialization_error``.
+    """
+    return json.dumps(
+        {
+            "event_id": event.event_id,
+            "event_type": str(getattr(event.event_type, "value", event.event_type)),
+            "timestamp": event.timestamp.isoformat(),
+            "actor": {
+                "api_key_fingerprint": event.api_key_fingerprint,
+                "client_ip": event.client_ip,
+                "user_agent": event.user_agent,
+            },
+            "operation": {
+                "entity_type": event.entity_type,
+                "entity_id": event.entity_id,
+                "action": event.operation,
+            },
+            "outcome": {
+                "status": str(getattr(event.outcome, "value", event.outcome)),
+                "reason": event.outcome_reason,
+                "duration_ms": event.duration_ms,
+            },
+            "metadata": event.metadata or {},
+            "serialization_error": repr(error),
+        },
+        default=str,
+    )
+
+
+class _LazyJSON:
+    """Log argument that serializes its event only when formatted.
+
+    Once ``AuditLogger.start()`` has run, formatting happens on the listener
+    thread, so serialization stays off the request path. The JSON is kept
+    after the first call so several handlers share one serialization.
+
+    An error there would never reach the caller, so an event the strict
+    encoder rejects is written with ``_encode_fallback`` instead of dropped.
+    """
+
+    __slots__ = ("_json", "event")
+
+    def __init__(self, event: AuditEvent):
+        self.event = event
+        self._json: str | None = None
+
+    def __str__(self) -> str:
+        if self._json is None:
+            try:
+                self._json = self.event.to_json()
+            except (KeyError, TypeError, ValueError) as e:
+                self._json = _encode_fallback(self.event, e)
+        return self._json
+
+
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records without formatting them.
+
+    The stock ``prepare`` merges the message on the calling thread; records
+    here never leave the process, so they are passed through unchanged and
+    the listener's handlers format them.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
 
 class AuditLogger:
     """Centralized audit logging system.
@@ -149,29 +293,102 @@ class AuditLogger:
     def __init__(self):
         """Initialize audit logger."""
         self.logger = logging.getLogger("audit")
-        self._request_counter = 0
+        # Event IDs share a prefix formatted once at startup; only the
+        # counter changes per event, so no clock read or strftime per call.
+        # next() on itertools.count is a single C call, so concurrent
+        # requests never observe the same value (no lock needed).
+        self._prefix = datetime.utcnow().strftime("%Y%m%d-%H%M%S")
+        self._counter = itertools.count(1)
+        self._queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        self._listener: QueueListener | None = None
+        self._queue_handler: _DeferredQueueHandler | None = None
+        self._saved_handlers: list[logging.Handler] = []
+        self._saved_propagate = True
+
+    def start(self) -> None:
+        """Move audit log writes off the request path.
+
+        The handlers that currently receive audit records (the ``audit``
+        logger's own, or the root logger's when it has none) are handed to a
+        background QueueListener. Afterwards ``log_event`` only enqueues the
+        record; formatting and stream writes happen on the listener thread.
+        """
+        if self._listener is not None:
+            return
+
+        handlers = list(self.logger.handlers) or list(logging.getLogger().handlers)
+        if not handlers:
+            return
+
+        self._saved_handlers = list(self.logger.handlers)
+        self._saved_propagate = self.logger.propagate
+        for handler in self._saved_handlers:
+            self.logger.removeHandler(handler)
+
+        self._queue_handler = _DeferredQueueHandler(self._queue)
+        self.logger.addHandler(self._queue_handler)
+        self.logger.propagate = False
+
+        self._listener = QueueListener(
+            self._queue, *handlers, respect_handler_level=True
+        )
+        self._listener.start()
+
+    def close(self) -> None:
+        """Flush queued audit records and restore the original handlers."""
+        if self._listener is None:
+            return
+
+        self._listener.stop()
+        self._listener = None
+
+        if self._queue_handler is not None:
+            self.logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        for handler in self._saved_handlers:
+            self.logger.addHandler(handler)
+        self.logger.propagate = self._saved_propagate
+        self._saved_handlers = []
 
     def _generate_event_id(self) -> str:
         """Generate unique event ID.
 
         Returns:
-            Event ID in format: YYYYMMDD-HHMMSS-COUNTER
+            Event ID in format: YYYYMMDD-HHMMSS-COUNTER, where the timestamp
+            is the logger's start time and COUNTER increases per event
         """
-        self._request_counter += 1
-        now = datetime.utcnow()
-        return f"{now.strftime('%Y%m%d-%H%M%S')}-{self._request_counter:06d}"
+        return f"{self._prefix}-{next(self._counter):06d}"
 
     def _fingerprint_api_key(self, api_key: str) -> str:
-        """Create SHA256 fingerprint of API key.
+        """Create BLAKE2b fingerprint of API key.
+
+        BLAKE2b with an 8-byte digest yields the same 16-hex-char identifier
+        the earlier truncated SHA256 did, at a fraction of the cost. Results
+        are not cached, so raw keys are never held beyond the request.
 
         Args:
             api_key: Full API key
 
         Returns:
-            First 16 characters of SHA256 hash
+            16-character hex digest of the key
         """
-        hash_obj = hashlib.sha256(api_key.encode())
-        return hash_obj.hexdigest()[:16]
+        return hashlib.blake2b(api_key.encode("utf-8"), digest_size=8).hexdigest()
+
+    def _resolve_fingerprint(
+        self, api_key: str | None, api_key_fingerprint: str | None
+    ) -> str | None:
+        """Return the caller's precomputed fingerprint, or hash the raw key.
+
+        Args:
+            api_key: Full API key (may be None)
+            api_key_fingerprint: Fingerprint already computed for this request
+
+        Returns:
+            API key fingerprint, or None if neither value is provided
+        """
+        if api_key_fingerprint is not None:
+            return api_key_fingerprint
+        return self._fingerprint_api_key(api_key) if api_key else None
 
     def log_event(self, event: AuditEvent) -> None:
         """Log audit event to structured log.
@@ -179,7 +396,11 @@ class AuditLogger:
         Args:
             event: Audit event to log
         """
-        self.logger.info(event.to_json())
+        # Skip serialization entirely when audit records would be dropped
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+        # Serialized only if a handler actually formats the record
+        self.logger.info("%s", _LazyJSON(event))
 
     def log_student_created(
         self,
@@ -190,6 +411,7 @@ class AuditLogger:
         duration_ms: float | None = None,
         success: bool = True,
         reason: str | None = None,
+        api_key_fingerprint: str | None = None,
     ) -> None:
         """Log student creation event.
 
@@ -201,11 +423,14 @@ class AuditLogger:
             duration_ms: Operation duration
             success: Whether operation succeeded
             reason: Failure reason if applicable
+            api_key_fingerprint: Precomputed fingerprint (skips hashing)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         event = AuditEvent(
             event_id=self._generate_event_id(),
             event_type=AuditEventType.STUDENT_CREATED,
-            api_key_fingerprint=self._fingerprint_api_key(api_key) if api_key else None,
+            api_key_fingerprint=self._resolve_fingerprint(api_key, api_key_fingerprint),
             client_ip=client_ip,
             entity_type="student",
             entity_id=student_id,
@@ -226,6 +451,7 @@ class AuditLogger:
         client_ip: str | None = None,
         duration_ms: float | None = None,
         found: bool = True,
+        api_key_fingerprint: str | None = None,
     ) -> None:
         """Log student retrieval event.
 
@@ -235,11 +461,14 @@ class AuditLogger:
             client_ip: Client IP
             duration_ms: Query duration
             found: Whether student was found
+            api_key_fingerprint: Precomputed fingerprint (skips hashing)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         event = AuditEvent(
             event_id=self._generate_event_id(),
             event_type=AuditEventType.STUDENT_READ,
-            api_key_fingerprint=self._fingerprint_api_key(api_key) if api_key else None,
+            api_key_fingerprint=self._resolve_fingerprint(api_key, api_key_fingerprint),
             client_ip=client_ip,
             entity_type="student",
             entity_id=student_id,
@@ -258,6 +487,7 @@ class AuditLogger:
         duration_ms: float | None = None,
         success: bool = True,
         reason: str | None = None,
+        api_key_fingerprint: str | None = None,
     ) -> None:
         """Log student deletion (soft delete) event.
 
@@ -268,11 +498,14 @@ class AuditLogger:
             duration_ms: Operation duration
             success: Whether deletion succeeded
             reason: Failure reason if applicable
+            api_key_fingerprint: Precomputed fingerprint (skips hashing)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         event = AuditEvent(
             event_id=self._generate_event_id(),
             event_type=AuditEventType.STUDENT_DELETED,
-            api_key_fingerprint=self._fingerprint_api_key(api_key) if api_key else None,
+            api_key_fingerprint=self._resolve_fingerprint(api_key, api_key_fingerprint),
             client_ip=client_ip,
             entity_type="student",
             entity_id=student_id,
@@ -288,6 +521,7 @@ class AuditLogger:
         api_key_provided: str | None,
         client_ip: str | None = None,
         reason: str = "invalid_api_key",
+        api_key_fingerprint: str | None = None,
     ) -> None:
         """Log authentication failure.
 
@@ -295,13 +529,16 @@ class AuditLogger:
             api_key_provided: API key that was provided (will be fingerprinted)
             client_ip: Client IP address
             reason: Reason for auth failure (missing, invalid, expired)
+            api_key_fingerprint: Precomputed fingerprint (skips hashing)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         event = AuditEvent(
             event_id=self._generate_event_id(),
             event_type=AuditEventType.AUTH_FAILURE,
-            api_key_fingerprint=self._fingerprint_api_key(api_key_provided)
-            if api_key_provided
-            else None,
+            api_key_fingerprint=self._resolve_fingerprint(
+                api_key_provided, api_key_fingerprint
+            ),
             client_ip=client_ip,
             entity_type=None,
             entity_id=None,
@@ -316,6 +553,7 @@ class AuditLogger:
         client_ip: str | None = None,
         api_key: str | None = None,
         endpoint: str | None = None,
+        api_key_fingerprint: str | None = None,
     ) -> None:
         """Log rate limit violation.
 
@@ -323,18 +561,21 @@ class AuditLogger:
             client_ip: Client IP that exceeded limit
             api_key: API key used (if any)
             endpoint: Endpoint that was rate limited
+            api_key_fingerprint: Precomputed fingerprint (skips hashing)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         event = AuditEvent(
             event_id=self._generate_event_id(),
             event_type=AuditEventType.RATE_LIMIT_EXCEEDED,
-            api_key_fingerprint=self._fingerprint_api_key(api_key) if api_key else None,
+            api_key_fingerprint=self._resolve_fingerprint(api_key, api_key_fingerprint),
             client_ip=client_ip,
             entity_type=None,
             entity_id=None,
             operation="rate_limit_check",
             outcome=AuditOutcome.FAILURE,
             outcome_reason="rate_limit_exceeded",
-            metadata={"endpoint": endpoint} if endpoint else None,
+            metadata=_endpoint_metadata(endpoint) if endpoint else None,
         )
         self.log_event(event)
 
@@ -346,6 +587,7 @@ class AuditLogger:
         entity_id: int | None = None,
         api_key: str | None = None,
         client_ip: str | None = None,
+        api_key_fingerprint: str | None = None,
     ) -> None:
         """Log database error.
 
@@ -356,11 +598,14 @@ class AuditLogger:
             entity_id: ID of entity involved
             api_key: API key used
             client_ip: Client IP
+            api_key_fingerprint: Precomputed fingerprint (skips hashing)
         """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
         event = AuditEvent(
             event_id=self._generate_event_id(),
             event_type=AuditEventType.DATABASE_ERROR,
-            api_key_fingerprint=self._fingerprint_api_key(api_key) if api_key else None,
+            api_key_fingerprint=self._resolve_fingerprint(api_key, api_key_fingerprint),
             client_ip=client_ip,
             entity_type=entity_type,
             entity_id=entity_id,
@@ -1,8 +1,23 @@
 """Configuration from environment variables."""
 
+import os
+
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
+def default_pool_size() -> int:
+    """Default DB_POOL_SIZE for one worker process.
+
+    Follows the HikariCP sizing rule of thumb, connections = (2 * cores) +
+    effective spindle count, taking one spindle and capping at 25. Past the
+    database's throughput sweet spot, extra connections only add contention
+    on the MSSQL server, so prefer lowering this over raising it when
+    running several workers.
+    """
+    return min(2 * (os.cpu_count() or 1) + 1, 25)
+
+
 class Settings(BaseSettings):
     """Application settings from environment.
 
@@ -17,11 +32,23 @@ class Settings(BaseSettings):
     LEGACY_DB_PASSWORD: str
     LEGACY_DB_NAME: str
 
+    # Connection pool (per worker process)
+    # DB_POOL_SIZE: maximum connections open at once (see default_pool_size)
+    # DB_POOL_MIN: connections opened and verified at startup
+    # DB_POOL_TIMEOUT: seconds a request waits for a free connection
+    DB_POOL_SIZE: int = Field(default_factory=default_pool_size, ge=1)
+    DB_POOL_MIN: int = Field(default=1, ge=1)
+    DB_POOL_TIMEOUT: float = Field(default=30.0, gt=0)
+
     # Security settings
     API_KEY: str
     ALLOWED_ORIGINS: str = "http://localhost:8000"
     ALLOWED_HOSTS: str = "legacy-adapter.vps.example.com,localhost"
+    # Reverse proxies whose X-Forwarded-For is trusted (comma-separated IPs/CIDRs)
+    TRUSTED_PROXIES: str = "127.0.0.1"
     RATE_LIMIT_PER_MINUTE: int = 60
+    # Shared rate limit store for multi-worker deployments (in-memory if unset)
+    REDIS_URL: str | None = None
 
     # Application settings
     DEBUG: bool = False
@@ -37,3 +64,6 @@ class Settings(BaseSettings):
 
 
 settings = Settings()
+
+# Derived values, computed once since settings do not change after startup
+LEGACY_DB_SERVER = f"{settings.LEGACY_DB_HOST}:{settings.LEGACY_DB_PORT}"
@@ -1,65 +1,77 @@
 """Database connection management for legacy MSSQL."""
 
+from __future__ import annotations
+
 import logging
+import queue
+import threading
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Self
 
 import pymssql
 from pymssql import Connection
 
-from .config import settings
+from .config import LEGACY_DB_SERVER, settings
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from pymssql import Cursor
 
 logger = logging.getLogger(__name__)
 
+# Idle connections are re-validated with SELECT 1 before reuse once they
+# have sat in the pool longer than this (MSSQL/firewalls drop idle sessions).
+POOL_RECYCLE_SECONDS = 300.0
 
-def get_connection() -> Connection:
-    """Get a database connection to legacy MSSQL 2012 server.
+# pymssql.connect() arguments, resolved from settings once at import.
+# These settings are required for MSSQL 2012 (see _new_connection).
+_CONNECT_KWARGS: dict[str, Any] = {
+    "server": LEGACY_DB_SERVER,
+    "user": settings.LEGACY_DB_USER,
+    "password": settings.LEGACY_DB_PASSWORD,
+    "database": settings.LEGACY_DB_NAME,
+    "timeout": 30,
+    "login_timeout": 30,
+    "appname": "LegacyAdapter",
+    "tds_version": "7.3",  # TDS 7.3 for MSSQL 2012
+}
+
+# LIFO so the most recently used (warmest) connection is handed out first
+_pool: queue.LifoQueue[tuple[Connection, float]] = queue.LifoQueue(
+    maxsize=settings.DB_POOL_SIZE
+)
+
+# One permit per connection that may be open at once; get_connection() waits
+# up to DB_POOL_TIMEOUT for a permit when all of them are checked out.
+_permits = threading.BoundedSemaphore(settings.DB_POOL_SIZE)
 
-    Creates a new connection each time with MSSQL 2012-compatible settings.
-    Uses TDS 7.3 protocol and disables encryption for compatibility.
+
+def _new_connection() -> Connection:
+    """Open a new connection to the legacy MSSQL 2012 server.
 
     IMPORTANT: These settings are required for MSSQL 2012:
     - TDS version 7.3 (not the default 7.4)
     - Encryption disabled (MSSQL 2012 doesn't support modern TLS)
     - Trust server certificate enabled
 
-    Creates a new connection each time. For production with high traffic,
-    consider implementing proper connection pooling (e.g., using SQLAlchemy).
-
     Returns:
         Active database connection
 
     Raises:
         pymssql.Error: If connection fails
-
-    Examples:
-        >>> conn = get_connection()
-        >>> cursor = conn.cursor()
-        >>> cursor.execute("SELECT @@VERSION")
-        >>> version = cursor.fetchone()
-        >>> cursor.close()
-        >>> conn.close()
     """
     try:
         logger.debug(
-            "Creating connection to %s:%s/%s (using direct connection with freetds_conf)",
-            settings.LEGACY_DB_HOST,
-            settings.LEGACY_DB_PORT,
+            "Creating connection to %s/%s (using direct connection with freetds_conf)",
+            LEGACY_DB_SERVER,
             settings.LEGACY_DB_NAME,
         )
 
         # CRITICAL: Pass connection string with freetds_config_file parameter
         # This ensures pymssql uses our FreeTDS configuration with encryption=off
-
-        conn = pymssql.connect(
-            server=f"{settings.LEGACY_DB_HOST}:{settings.LEGACY_DB_PORT}",
-            user=settings.LEGACY_DB_USER,
-            password=settings.LEGACY_DB_PASSWORD,
-            database=settings.LEGACY_DB_NAME,
-            timeout=30,
-            login_timeout=30,
-            appname="LegacyAdapter",
-            # Use the freetds.conf configuration file
-            tds_version="7.3",  # TDS 7.3 for MSSQL 2012
-        )
+        conn = pymssql.connect(**_CONNECT_KWARGS)
 
         logger.debug("Database connection established successfully")
         return conn
@@ -72,9 +84,180 @@ def get_connection() -> Connection:
         raise
 
 
+def _ping(conn: Connection) -> bool:
+    """Return True if the connection still answers a trivial query."""
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchone()
+        cursor.close()
+        return True
+    except Exception:
+        return False
+
+
+def _discard(conn: Connection) -> None:
+    """Close a connection that is not going back into the pool."""
+    try:
+        conn.close()
+    except Exception as e:
+        logger.debug("Ignoring error while closing connection: %s", str(e))
+
+
+class PooledConnection:
+    """Pool-aware proxy around a pymssql connection.
+
+    Behaves like the wrapped connection (cursor, commit, rollback, ...), but
+    ``close()`` returns the connection to the pool instead of closing the
+    socket. A connection that was rolled back is discarded on release, since
+    the failure may have left the session in an unknown state.
+    """
+
+    __slots__ = ("_broken", "_conn", "_permit")
+
+    def __init__(self, conn: Connection, permit: threading.BoundedSemaphore):
+        self._conn: Connection | None = conn
+        self._broken = False
+        self._permit = permit
+
+    def __getattr__(self, name: str) -> Any:
+        if self._conn is None:
+            raise pymssql.InterfaceError("Connection already returned to pool")
+        return getattr(self._conn, name)
+
+    def rollback(self) -> None:
+        """Roll back and mark the connection as unfit for reuse."""
+        self._broken = True
+        if self._conn is not None:
+            self._conn.rollback()
+
+    def close(self) -> None:
+        """Return the connection to the pool (idempotent)."""
+        conn, self._conn = self._conn, None
+        if conn is None:
+            return
+        try:
+            if self._broken:
+                _discard(conn)
+                return
+            try:
+                _pool.put_nowait((conn, time.monotonic()))
+            except queue.Full:
+                _discard(conn)
+        finally:
+            self._permit.release()
+
+    def __del__(self) -> None:
+        # Safety net for callers that never close(): free the permit so the
+        # pool does not shrink, but drop the connection since its state is
+        # unknown.
+        if self._conn is not None:
+            self._broken = True
+            self.close()
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self._broken = True
+        self.close()
+
+
+def get_connection() -> PooledConnection:
+    """Get a database connection to legacy MSSQL 2012 server.
+
+    Reuses an idle pooled connection when one is available, so the TDS login
+    handshake is paid once per pooled connection rather than per request.
+    At most DB_POOL_SIZE connections are checked out at once; further callers
+    wait up to DB_POOL_TIMEOUT seconds for one to be returned.
+    Connections idle for longer than POOL_RECYCLE_SECONDS are checked with
+    ``SELECT 1`` and replaced if the server dropped them. Calling ``close()``
+    on the returned object hands the connection back to the pool.
+
+    Returns:
+        Active database connection (pool-aware proxy)
+
+    Raises:
+        pymssql.Error: If a new connection is needed and connecting fails
+        RuntimeError: If no connection is free within DB_POOL_TIMEOUT
+
+    Examples:
+        >>> conn = get_connection()
+        >>> cursor = conn.cursor()
+        >>> cursor.execute("SELECT @@VERSION")
+        >>> version = cursor.fetchone()
+        >>> cursor.close()
+        >>> conn.close()  # returns the connection to the pool
+    """
+    permit = _permits
+    if not permit.acquire(timeout=settings.DB_POOL_TIMEOUT):
+        logger.error(
+            "❌ No database connection free after %.1fs", settings.DB_POOL_TIMEOUT
+        )
+        raise RuntimeError("Timed out waiting for a database connection")
+
+    try:
+        while True:
+            try:
+                conn, released_at = _pool.get_nowait()
+            except queue.Empty:
+                return PooledConnection(_new_connection(), permit)
+
+            if time.monotonic() - released_at < POOL_RECYCLE_SECONDS or _ping(conn):
+                return PooledConnection(conn, permit)
+
+            logger.info("Discarding stale pooled database connection")
+            _discard(conn)
+    except BaseException:
+        permit.release()
+        raise
+
+
+@contextmanager
+def db_cursor(as_dict: bool = False) -> Iterator[tuple[PooledConnection, Cursor]]:
+    """Check out a pooled connection and cursor for the duration of a block.
+
+    The cursor is closed and the connection handed back to the pool however
+    the block exits. If it raises, the connection is rolled back first,
+    which also keeps it out of the pool. Commit explicitly inside the block
+    for writes.
+
+    Args:
+        as_dict: Return rows as dicts keyed by column name
+
+    Yields:
+        ``(connection, cursor)`` tuple
+
+    Raises:
+        pymssql.Error: If connecting fails
+        RuntimeError: If no connection is free within DB_POOL_TIMEOUT
+
+    Examples:
+        >>> with db_cursor(as_dict=True) as (conn, cursor):
+        ...     cursor.execute("SELECT ID FROM Students WHERE ID = %s", ("1",))
+        ...     row = cursor.fetchone()
+    """
+    conn = get_connection()
+    try:
+        cursor = conn.cursor(as_dict=as_dict)
+        try:
+            yield conn, cursor
+        finally:
+            cursor.close()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
 def test_connection() -> bool:
     """Test database connection and return True if successful.
 
+    Always opens a fresh connection so the result reflects the server's
+    current reachability rather than a pooled session.
+
     Returns:
         True if connection successful, False otherwise
 
@@ -83,7 +266,7 @@ def test_connection() -> bool:
         ...     print("Database is accessible")
     """
     try:
-        conn = get_connection()
+        conn = _new_connection()
         cursor = conn.cursor()
         cursor.execute("SELECT 1")
         result = cursor.fetchone()
@@ -95,25 +278,56 @@ def test_connection() -> bool:
         return False
 
 
-def init_connection_pool():
+def init_connection_pool(size: int | None = None, min_size: int | None = None):
     """Initialize connection pool on startup.
 
-    Currently a no-op placeholder. Implement if you need connection pooling.
+    Opens ``min_size`` connections, verifies each with ``SELECT 1`` and parks
+    them in the pool so the first requests do not pay the login cost.
+
+    Args:
+        size: Maximum open connections (default: settings.DB_POOL_SIZE)
+        min_size: Connections to open up front (default: settings.DB_POOL_MIN)
+
+    Raises:
+        RuntimeError: If the legacy database cannot be reached
     """
-    logger.info("Initializing database connection pool...")
-    # Test initial connection
-    if test_connection():
-        logger.info("✅ Database connection pool initialized successfully")
-    else:
-        logger.error("❌ Failed to initialize database connection pool")
-        raise RuntimeError("Cannot connect to legacy database")
+    global _pool, _permits
 
+    size = size or settings.DB_POOL_SIZE
+    min_size = min(min_size or settings.DB_POOL_MIN, size)
 
-def close_connection_pool():
-    """Close all connections in pool.
+    logger.info("Initializing database connection pool (size=%d)...", size)
+    if size != _pool.maxsize:
+        close_connection_pool()
+        _pool = queue.LifoQueue(maxsize=size)
+        _permits = threading.BoundedSemaphore(size)
 
-    Currently a no-op placeholder. Implement if you need connection pooling.
-    """
+    for _ in range(min_size):
+        try:
+            conn = _new_connection()
+        except Exception as e:
+            logger.error("❌ Failed to initialize database connection pool")
+            raise RuntimeError("Cannot connect to legacy database") from e
+
+        if not _ping(conn):
+            _discard(conn)
+            logger.error("❌ Failed to initialize database connection pool")
+            raise RuntimeError("Cannot connect to legacy database")
+
+        _pool.put_nowait((conn, time.monotonic()))
+
+    logger.info("✅ Database connection pool initialized successfully")
+
+
+def close_connection_pool():
+    """Close all idle connections in the pool."""
     logger.info("Closing database connection pool...")
-    # No cleanup needed for single-connection model
-    logger.info("✅ Database connection pool closed")
+    closed = 0
+    while True:
+        try:
+            conn, _released_at = _pool.get_nowait()
+        except queue.Empty:
+            break
+        _discard(conn)
+        closed += 1
+    logger.info("✅ Database connection pool closed (%d connections)", closed)
@@ -16,18 +16,32 @@ Version: 1.0.0
 
 from __future__ import annotations
 
+import functools
+import hmac
+import itertools
+import json
 import logging
-from collections import defaultdict
-from contextlib import asynccontextmanager
-from datetime import datetime, timedelta
-
-from fastapi import Depends, FastAPI, Header, HTTPException, Request, status
+import re
+import threading
+import uuid
+from collections import defaultdict, deque
+from contextlib import ExitStack, asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from time import monotonic, perf_counter
+from typing import TYPE_CHECKING
+
+from fastapi import FastAPI, HTTPException, Query, Request, Response, status
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic_core import to_json
+from uvicorn.middleware.proxy_headers import ProxyHeadersMiddleware
 
+from .audit import audit_logger
 from .config import settings
-from .database import close_connection_pool, get_connection, init_connection_pool
+from .database import close_connection_pool, db_cursor, init_connection_pool
 from .models import (
     HealthCheckResponse,
     LegacyAcademicClass,
@@ -35,17 +49,75 @@ from .models import (
     LegacyStudentRecord,
     StudentUpdateRequest,
 )
+from .rate_limit import RedisRateLimiter
+
+if TYPE_CHECKING:
+    from collections.abc import Generator, Iterator
+    from typing import Any, TypeVar
+
+    from pydantic import BaseModel
+    from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+    ModelT = TypeVar("ModelT", bound=BaseModel)
+
+# Correlation ID of the request being handled ("-" outside a request)
+REQUEST_ID: ContextVar[str] = ContextVar("request_id", default="-")
+
+# Client-supplied X-Request-ID values are only trusted in this shape
+_REQUEST_ID_PATTERN = re.compile(r"[A-Za-z0-9._-]{1,128}")
+
+_base_record_factory = logging.getLogRecordFactory()
+
+
+def _record_factory(*args, **kwargs) -> logging.LogRecord:
+    """Stamp every log record with the current request ID.
+
+    Done at record creation, in the logging call's own context, so the ID
+    survives handlers that run on the audit QueueListener thread.
+    """
+    record = _base_record_factory(*args, **kwargs)
+    record.request_id = REQUEST_ID.get()
+    return record
+
+
+logging.setLogRecordFactory(_record_factory)
 
 # Configure logging
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+    format="%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s",
 )
 logger = logging.getLogger(__name__)
 
+# One JSON object per request, so log pipelines can index fields directly
+access_logger = logging.getLogger("access")
+
+# Expected API key, encoded once for constant-time comparison
+_API_KEY_BYTES = settings.API_KEY.encode("utf-8")
+
 # Simple rate limiting (in-memory, per IP)
-# For production with multiple instances, use Redis-based rate limiting
-rate_limit_store: dict[str, list[datetime]] = defaultdict(list)
+# For production with multiple instances, set REDIS_URL (see rate_limit.py)
+# Each IP maps to the monotonic timestamps of its requests, oldest first; no
+# lock is needed because check_rate_limit never awaits.
+rate_limit_store: defaultdict[str, deque[float]] = defaultdict(deque)
+
+# IPs that stop sending requests are evicted lazily by a periodic sweep
+RATE_LIMIT_SWEEP_INTERVAL = 300.0
+_rate_limit_last_sweep = monotonic()
+
+
+def _sweep_rate_limit_store(cutoff: float) -> None:
+    """Remove IPs with no requests newer than ``cutoff`` from the store."""
+    for ip in list(rate_limit_store):
+        timestamps = rate_limit_store[ip]
+        while timestamps and timestamps[0] <= cutoff:
+            timestamps.popleft()
+        if not timestamps:
+            del rate_limit_store[ip]
+
+
+# Shared Redis limiter, set in lifespan when REDIS_URL is configured
+redis_limiter: RedisRateLimiter | None = None
 
 
 def check_rate_limit(ip: str, limit: int = 60) -> bool:
@@ -58,23 +130,260 @@ def check_rate_limit(ip: str, limit: int = 60) -> bool:
     Returns:
         True if under limit, False if exceeded
     """
-    now = datetime.now()
-    cutoff = now - timedelta(minutes=1)
+    global _rate_limit_last_sweep
+    now = monotonic()
+    cutoff = now - 60.0
+
+    # Periodically evict idle IPs so the store does not grow without bound
+    if now - _rate_limit_last_sweep > RATE_LIMIT_SWEEP_INTERVAL:
+        _sweep_rate_limit_store(cutoff)
+        _rate_limit_last_sweep = now
 
-    # Clean old requests
-    rate_limit_store[ip] = [
-        req_time for req_time in rate_limit_store[ip] if req_time > cutoff
-    ]
+    timestamps = rate_limit_store[ip]
+
+    # Drop requests that have left the window (oldest are at the front)
+    while timestamps and timestamps[0] <= cutoff:
+        timestamps.popleft()
 
     # Check limit
-    if len(rate_limit_store[ip]) >= limit:
+    if len(timestamps) >= limit:
         return False
 
     # Record this request
-    rate_limit_store[ip].append(now)
+    timestamps.append(now)
     return True
 
 
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered by pydantic-core's Rust encoder.
+
+    Produces the same compact UTF-8 output as JSONResponse, without the
+    extra orjson dependency. NaN/Infinity become null instead of raising.
+    """
+
+    def render(self, content) -> bytes:
+        return to_json(content, inf_nan_mode="null")
+
+
+def _error_messages(status_code: int, detail: str) -> tuple[Message, Message]:
+    """Build the ASGI messages for a JSON ``{"detail": ...}`` error response.
+
+    Middleware rejections are sent as these prebuilt messages, which match
+    the body FastAPI produces for an HTTPException with the same detail.
+    """
+    body = json.dumps({"detail": detail}, separators=(",", ":")).encode("utf-8")
+    start = {
+        "type": "http.response.start",
+        "status": status_code,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ],
+    }
+    return start, {"type": "http.response.body", "body": body}
+
+
+_RATE_LIMITED = _error_messages(
+    status.HTTP_429_TOO_MANY_REQUESTS, "Rate limit exceeded. Try again later."
+)
+_API_KEY_REQUIRED = _error_messages(status.HTTP_401_UNAUTHORIZED, "API key required")
+_API_KEY_INVALID = _error_messages(status.HTTP_401_UNAUTHORIZED, "Invalid API key")
+
+# Path prefixes that require the X-API-Key header
+AUTH_REQUIRED_PREFIXES = ("/students", "/enrollments", "/classes")
+
+
+def _client_ip(scope: Scope) -> str:
+    """Return the client host from an ASGI scope, or "unknown".
+
+    The result is cached in the scope state, so the rate limit, auth and
+    access log middlewares resolve it once per request.
+    """
+    state = scope.setdefault("state", {})
+    ip = state.get("client_ip")
+    if ip is None:
+        client = scope.get("client")
+        ip = state["client_ip"] = client[0] if client else "unknown"
+    return ip
+
+
+class RateLimitASGI:
+    """Rate limiting middleware.
+
+    Limits requests to RATE_LIMIT_PER_MINUTE per IP address.
+    Health check endpoint is excluded from rate limiting.
+
+    Implemented as plain ASGI rather than ``@app.middleware("http")`` so
+    requests are not routed through Starlette's BaseHTTPMiddleware bridge.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # Skip rate limiting for non-HTTP traffic and the health check
+        if scope["type"] != "http" or scope["path"] == "/health":
+            await self.app(scope, receive, send)
+            return
+
+        client_ip = _client_ip(scope)
+        limit = settings.RATE_LIMIT_PER_MINUTE
+
+        allowed = None
+        if redis_limiter is not None:
+            allowed = await redis_limiter.allow(client_ip, limit)
+        if allowed is None:
+            allowed = check_rate_limit(client_ip, limit=limit)
+
+        if not allowed:
+            logger.warning("⚠️  Rate limit exceeded for IP: %s", client_ip)
+            await send(_RATE_LIMITED[0])
+            await send(_RATE_LIMITED[1])
+            return
+
+        await self.app(scope, receive, send)
+
+
+class AuthASGI:
+    """API key authentication for the data endpoints.
+
+    Requests under AUTH_REQUIRED_PREFIXES must carry an X-API-Key header
+    matching settings.API_KEY. Rejections are answered with 401 before
+    routing, so no FastAPI dependency resolution runs for them.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or not scope["path"].startswith(
+            AUTH_REQUIRED_PREFIXES
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        api_key = None
+        for name, value in scope["headers"]:
+            if name == b"x-api-key":
+                api_key = value
+                break
+
+        if not api_key:
+            logger.warning("⚠️  Request without API key from %s", _client_ip(scope))
+            rejection = _API_KEY_REQUIRED
+        elif not hmac.compare_digest(api_key, _API_KEY_BYTES):
+            if logger.isEnabledFor(logging.WARNING):
+                logger.warning(
+                    "⚠️  Invalid API key attempt: %s...",
+                    api_key[:10].decode("latin-1"),
+                )
+            rejection = _API_KEY_INVALID
+        else:
+            await self.app(scope, receive, send)
+            return
+
+        await send(rejection[0])
+        await send(rejection[1])
+
+
+class RequestIDASGI:
+    """Assign each request a correlation ID for log tracing.
+
+    Reuses a well-formed incoming X-Request-ID header or generates one, makes
+    it available to every log record through REQUEST_ID, and echoes it back
+    in the X-Request-ID response header.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = None
+        for name, value in scope["headers"]:
+            if name == b"x-request-id":
+                candidate = value.decode("latin-1")
+                if _REQUEST_ID_PATTERN.fullmatch(candidate):
+                    request_id = candidate
+                break
+        if request_id is None:
+            request_id = uuid.uuid4().hex
+
+        header = (b"x-request-id", request_id.encode("latin-1"))
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message = {**message, "headers": [*message.get("headers", ()), header]}
+            await send(message)
+
+        token = REQUEST_ID.set(request_id)
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUEST_ID.reset(token)
+
+
+class _AccessRecord:
+    """Access log argument that serializes to JSON only when formatted."""
+
+    __slots__ = ("fields",)
+
+    def __init__(self, **fields) -> None:
+        self.fields = fields
+
+    def __str__(self) -> str:
+        return json.dumps(self.fields, separators=(",", ":"))
+
+
+class AccessLogASGI:
+    """Log all requests for security audit.
+
+    Each request is logged to the ``access`` logger as a JSON object with
+    method, path, status, duration_ms and ip. Health check polls are not
+    logged; they would drown out real traffic.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["path"] == "/health"
+            or not access_logger.isEnabledFor(logging.INFO)
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        start_time = perf_counter()
+        status_code = status.HTTP_500_INTERNAL_SERVER_ERROR
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+            if message["type"] == "http.response.body" and not message.get(
+                "more_body", False
+            ):
+                duration = perf_counter() - start_time
+                access_logger.info(
+                    "%s",
+                    _AccessRecord(
+                        method=scope["method"],
+                        path=scope["path"],
+                        status=status_code,
+                        duration_ms=round(duration * 1000, 3),
+                        ip=_client_ip(scope),
+                    ),
+                )
+
+        await self.app(scope, receive, send_wrapper)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize and cleanup connection pool."""
@@ -88,11 +397,29 @@ async def lifespan(app: FastAPI):
     logger.info("🔒 Security: API Key authentication enabled")
     logger.info("⏱️  Rate limiting: %d requests/minute", settings.RATE_LIMIT_PER_MINUTE)
 
-    init_connection_pool()
+    global redis_limiter
+    if settings.REDIS_URL:
+        limiter = RedisRateLimiter(settings.REDIS_URL)
+        if await limiter.connect():
+            redis_limiter = limiter
+            logger.info("⏱️  Rate limit store: Redis")
+
+    logger.info(
+        "🗄️  Database pool: up to %d connections (%d at startup, %.0fs wait)",
+        settings.DB_POOL_SIZE,
+        settings.DB_POOL_MIN,
+        settings.DB_POOL_TIMEOUT,
+    )
+    init_connection_pool(size=settings.DB_POOL_SIZE, min_size=settings.DB_POOL_MIN)
+    audit_logger.start()
     yield
 
     logger.info("🛑 Shutting down Legacy Adapter Service")
+    audit_logger.close()
     close_connection_pool()
+    if redis_limiter is not None:
+        await redis_limiter.close()
+        redis_limiter = None
 
 
 app = FastAPI(
@@ -100,10 +427,15 @@ app = FastAPI(
     description="Secure bridge service between Django SIS and legacy MSSQL database",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=FastJSONResponse,
     docs_url="/docs" if settings.DEBUG else None,  # Disable docs in production
     redoc_url="/redoc" if settings.DEBUG else None,
 )
 
+# Authentication sits inside CORS so preflight requests are answered without
+# an API key and 401 responses still carry the CORS headers
+app.add_middleware(AuthASGI)
+
 # CORS middleware (restrict to your domains)
 app.add_middleware(
     CORSMiddleware,
@@ -119,119 +451,344 @@ if not settings.DEBUG:
         TrustedHostMiddleware, allowed_hosts=settings.ALLOWED_HOSTS.split(",")
     )
 
+# The last middleware added runs first: the client IP is resolved from trusted
+# proxy headers, then requests get an ID, are logged, rate limited, and
+# handed to CORS and authentication
+app.add_middleware(RateLimitASGI)
+app.add_middleware(AccessLogASGI)
+app.add_middleware(RequestIDASGI)
+app.add_middleware(
+    ProxyHeadersMiddleware,
+    trusted_hosts=[host.strip() for host in settings.TRUSTED_PROXIES.split(",")],
+)
+
+
+# SQL statements, built once at import rather than on every request
+HEALTH_CHECK_SQL = "SELECT 1"
+
+GET_STUDENT_SQL = """
+    SELECT
+        ID, Name, KName, BirthDate, BirthPlace, Gender,
+        Email, MobilePhone, HomePhone, HomeAddress,
+        Status, Admitted, Deleted,
+        AdmissionDate, AdmissionDateForUnder, AdmissionDateForMaster,
+        SelectedProgram, SelectedMajor, SelectedFaculty,
+        Firstenroll, Lastenroll,
+        BAStartDate, BAEndDate, MAStartDate, MAEndDate,
+        Transfer, CreatedDate, ModifiedDate
+    FROM Students
+    WHERE ID = %s
+"""
+
+SOFT_DELETE_STUDENT_SQL = "UPDATE Students SET Status = 'Inactive' WHERE ID = %s"
+
+ENROLLMENTS_SELECT_SQL = """
+    SELECT
+        IPK, ID, ClassID, RepeatNum, LScore, UScore,
+        Credit, GradePoint, TotalPoint, Grade, PreviousGrade,
+        Passed, Remarks, RegisterMode, Attendance,
+        AddTime, LastUpdate,
+        NormalizedCourse, NormalizedPart, NormalizedSection
+    FROM AcademicCourseTakers
+    WHERE {where_clause}
+    ORDER BY ClassID, ID, IPK
+"""
+
+CLASSES_SELECT_SQL = """
+    SELECT
+        IPK, TermID, Program, Major, GroupID, CourseCode, ClassID,
+        CourseTitle, StNumber, CourseType, SchoolTime, Subject,
+        NormalizedCourse, NormalizedPart, NormalizedSection, NormalizedTOD,
+        CreatedDate, ModifiedDate
+    FROM AcademicClasses
+    WHERE {where_clause}
+    ORDER BY ClassID, IPK
+"""
+
+
+# Appended to a list query when the client asks for a page (OFFSET/FETCH needs
+# MSSQL 2012+). Without limit or offset every matching row is returned.
+PAGE_CLAUSE = "    OFFSET %s ROWS FETCH NEXT %s ROWS ONLY\n"
+
+# Page size bounds; DEFAULT_PAGE_SIZE applies when only offset is given
+DEFAULT_PAGE_SIZE = 500
+MAX_PAGE_SIZE = 5000
 
-async def verify_api_key(x_api_key: str = Header(None)):
-    """Verify API key for authentication.
+
+def set_next_page_link(
+    request: Request, response: Response, offset: int, limit: int, count: int
+) -> None:
+    """Add an RFC 8288 ``Link: <...>; rel="next"`` header after a full page.
 
     Args:
-        x_api_key: API key from X-API-Key header
+        request: Current request (its URL is reused with a new offset)
+        response: Response to add the header to
+        offset: Offset of the page being returned
+        limit: Requested page size
+        count: Rows actually returned
+    """
+    if count == limit:
+        next_url = request.url.include_query_params(offset=offset + limit)
+        response.headers["Link"] = f'<{next_url}>; rel="next"'
 
-    Raises:
-        HTTPException: 401 if API key is missing or invalid
+
+def compile_filtered_selects(
+    select_sql: str, conditions: tuple[str, ...]
+) -> dict[tuple[bool, ...], str]:
+    """Pre-build a SELECT for every non-empty combination of filters.
+
+    Args:
+        select_sql: Statement with a ``{where_clause}`` placeholder
+        conditions: One parameterized condition per optional filter
+
+    Returns:
+        Statements keyed by a tuple of which filters are set, in
+        ``conditions`` order
     """
-    if not x_api_key:
-        logger.warning("⚠️  Request without API key from %s", "unknown")
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="API key required"
+    return {
+        key: select_sql.format(
+            where_clause=" AND ".join(
+                condition
+                for condition, used in zip(conditions, key, strict=True)
+                if used
+            )
         )
+        for key in itertools.product((False, True), repeat=len(conditions))
+        if any(key)
+    }
 
-    if x_api_key != settings.API_KEY:
-        logger.warning(
-            "⚠️  Invalid API key attempt: %s...", x_api_key[:10] if x_api_key else "None"
-        )
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key"
-        )
 
+# Filters: term (ClassID prefix before first !$), course, student
+ENROLLMENTS_SQL = compile_filtered_selects(
+    ENROLLMENTS_SELECT_SQL,
+    ("ClassID LIKE %s", "NormalizedCourse LIKE %s", "ID = %s"),
+)
 
-@app.middleware("http")
-async def rate_limit_middleware(request: Request, call_next):
-    """Rate limiting middleware.
+# Filters: term (TermID), course
+CLASSES_SQL = compile_filtered_selects(
+    CLASSES_SELECT_SQL, ("TermID = %s", "NormalizedCourse LIKE %s")
+)
 
-    Limits requests to RATE_LIMIT_PER_MINUTE per IP address.
-    Health check endpoint is excluded from rate limiting.
+# Paged variants, used when the request carries limit or offset
+ENROLLMENTS_PAGED_SQL = {key: sql + PAGE_CLAUSE for key, sql in ENROLLMENTS_SQL.items()}
+CLASSES_PAGED_SQL = {key: sql + PAGE_CLAUSE for key, sql in CLASSES_SQL.items()}
+
+
+# Columns update_student may write. Field names are interpolated into the SET
+# clause, so the builder rejects anything outside this set.
+UPDATABLE_STUDENT_COLUMNS = frozenset(StudentUpdateRequest.model_fields)
+
+
+@functools.lru_cache(maxsize=256)
+def build_update_student_sql(fields: tuple[str, ...]) -> str:
+    """Build the UPDATE statement for a set of student columns.
+
+    Cached per column tuple, so callers should pass the fields in a stable
+    (sorted) order and supply parameter values in that same order. The column
+    check therefore runs once per field set, not per request.
+
+    Args:
+        fields: Column names to set, in parameter order
+
+    Returns:
+        Parameterized UPDATE statement ending with the ID placeholder
+
+    Raises:
+        ValueError: If a field is not an updatable student column
     """
-    # Skip rate limiting for health check
-    if request.url.path == "/health":
-        return await call_next(request)
-
-    # Get client IP
-    client_ip = request.client.host if request.client else "unknown"
-
-    # Check rate limit
-    if not check_rate_limit(client_ip, limit=settings.RATE_LIMIT_PER_MINUTE):
-        logger.warning("⚠️  Rate limit exceeded for IP: %s", client_ip)
-        return JSONResponse(
-            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-            content={"detail": "Rate limit exceeded. Try again later."},
-        )
+    unknown = set(fields) - UPDATABLE_STUDENT_COLUMNS
+    if unknown:
+        raise ValueError(f"Not updatable student columns: {sorted(unknown)}")
+    set_clause = ", ".join(f"{field} = %s" for field in fields)
+    return f"UPDATE Students SET {set_clause}, ModifiedDate = GETDATE() WHERE ID = %s"
 
-    return await call_next(request)
 
+def rows_to_models(model: type[ModelT], rows: list[Any]) -> list[ModelT]:  # noqa: UP047
+    """Validate database rows into response models.
 
-@app.middleware("http")
-async def log_requests(request: Request, call_next):
-    """Log all requests for security audit."""
-    start_time = datetime.now()
+    Validation coerces driver types to the model's field types (a Decimal
+    score becomes a float, a numeric string key an int), so responses serialize
+    the same way regardless of what pymssql returned.
 
-    # Process request
-    response = await call_next(request)
+    Args:
+        model: Pydantic model describing one row
+        rows: Rows from an ``as_dict`` cursor
 
-    # Calculate duration
-    duration = (datetime.now() - start_time).total_seconds()
+    Returns:
+        One model instance per row
+    """
+    validate = model.model_validate
+    return [validate(row) for row in rows]
+
+
+# Rows fetched per round trip when streaming results as NDJSON
+STREAM_PAGE_SIZE = 500
+
+
+def stream_ndjson_rows(cursor, model: type[BaseModel]) -> Generator[bytes]:
+    """Yield the cursor's remaining rows as NDJSON, one page at a time.
+
+    Each row is validated through ``model`` so streamed records serialize
+    exactly like the list response.
+
+    Args:
+        cursor: ``as_dict`` cursor with a pending result set
+        model: Pydantic model describing one row
+
+    Yields:
+        One chunk of newline-terminated JSON objects per fetched page
+    """
+    try:
+        while rows := cursor.fetchmany(STREAM_PAGE_SIZE):
+            yield "".join(
+                model.model_validate(row).model_dump_json() + "\n" for row in rows
+            ).encode("utf-8")
+    except Exception as e:
+        logger.error("❌ Error streaming %s rows: %s", model.__name__, str(e))
+        raise
 
-    # Log request details
-    client_ip = request.client.host if request.client else "unknown"
-    logger.info(
-        "📝 %s %s - %s - %.3fs - IP: %s",
-        request.method,
-        request.url.path,
-        response.status_code,
-        duration,
-        client_ip,
-    )
 
-    return response
+class NDJSONStreamingResponse(StreamingResponse):
+    """NDJSON stream that owns the database cursor its rows come from.
+
+    Starlette abandons the row iterator when the client disconnects, which
+    would keep the connection checked out until garbage collection. Once the
+    response finishes, fails or is cut short, the generator and the
+    ``db_cursor`` context are closed here instead.
+
+    Rows are pulled on threadpool threads, so a lock serializes each fetch
+    with the release: the cursor is only closed once any in-flight fetch has
+    returned, and no fetch starts after it.
+
+    A stream that did not run to its last row (fetch or validation error,
+    client disconnect) may leave the session mid-result, so its connection is
+    rolled back and discarded rather than returned to the pool.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def __init__(self, rows: Generator[bytes], resources: ExitStack) -> None:
+        """Initialize the response.
+
+        Args:
+            rows: Generator from ``stream_ndjson_rows``
+            resources: Exit stack holding the cursor's connection
+        """
+        self._rows = rows
+        self._resources = resources
+        self._lock = threading.Lock()
+        self._released = False
+        self._finished = False
+        self._error: BaseException | None = None
+        super().__init__(self._guarded_rows())
+
+    def _guarded_rows(self) -> Iterator[bytes]:
+        """Yield chunks from the row generator until it ends or is released."""
+        while True:
+            with self._lock:
+                if self._released:
+                    return
+                try:
+                    chunk = next(self._rows, None)
+                except BaseException as e:
+                    self._error = e
+                    raise
+                if chunk is None:
+                    self._finished = True
+                    return
+            yield chunk
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # Waits for an in-flight fetch, so it runs off the event loop
+            await run_in_threadpool(self._release)
+
+    def _release(self) -> None:
+        """Close the row generator, then release the cursor and connection."""
+        with self._lock:
+            self._released = True
+            try:
+                self._rows.close()
+            finally:
+                if self._finished:
+                    self._resources.close()
+                else:
+                    # Let db_cursor see the failure so it rolls back and
+                    # discards the connection
+                    error = self._error or ConnectionAbortedError(
+                        "NDJSON stream closed before its last row"
+                    )
+                    self._resources.__exit__(type(error), error, error.__traceback__)
+
+
+# Database route handlers are plain ``def`` functions: pymssql calls block, so
+# FastAPI runs these handlers in its worker threadpool instead of on the event
+# loop, and a slow query no longer stalls every other in-flight request.
+
+
+# Health probes arrive every few seconds from load balancers/orchestrators, so
+# the database result is reused for this long instead of spending a pool
+# connection and a round trip on every poll.
+HEALTH_CACHE_TTL = 2.0
+
+# (monotonic time of last probe, error message or None when healthy)
+_health_cache: tuple[float, str | None] | None = None
+
+
+def _probe_database() -> str | None:
+    """Run SELECT 1 on a pooled connection.
+
+    Returns:
+        None if the database answered, otherwise the error message
+    """
+    try:
+        with db_cursor() as (_conn, cursor):
+            cursor.execute(HEALTH_CHECK_SQL)
+            cursor.fetchone()
+        return None
+    except Exception as e:
+        logger.error("❌ Health check failed: %s", str(e))
+        return str(e)
 
 
 @app.get("/health", response_model=HealthCheckResponse)
-async def health_check():
+def health_check():
     """Health check endpoint (no auth required).
 
+    The database probe result is cached for HEALTH_CACHE_TTL seconds.
+
     Returns:
         Health status including database connectivity
     """
-    try:
-        conn = get_connection()
-        cursor = conn.cursor()
-        cursor.execute("SELECT 1")
-        cursor.fetchone()
-        cursor.close()
-        conn.close()
+    global _health_cache
 
+    now = monotonic()
+    if _health_cache is None or now - _health_cache[0] >= HEALTH_CACHE_TTL:
+        _health_cache = (now, _probe_database())
+    error = _health_cache[1]
+
+    if error is None:
         return HealthCheckResponse(
             status="healthy",
             database="connected",
             timestamp=datetime.now().isoformat(),
         )
-    except Exception as e:
-        logger.error("❌ Health check failed: %s", str(e))
-        return JSONResponse(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            content={
-                "status": "unhealthy",
-                "database": "disconnected",
-                "error": str(e),
-                "timestamp": datetime.now().isoformat(),
-            },
-        )
 
+    return FastJSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={
+            "status": "unhealthy",
+            "database": "disconnected",
+            "error": error,
+            "timestamp": datetime.now().isoformat(),
+        },
+    )
 
-@app.put(
-    "/students/{student_id}",
-    dependencies=[Depends(verify_api_key)],
-)
-async def update_student(student_id: str, request: StudentUpdateRequest) -> dict:
+
+@app.put("/students/{student_id}")
+def update_student(student_id: str, request: StudentUpdateRequest) -> dict:
     """Update student record in legacy database.
 
     🔒 Requires API key authentication
@@ -263,62 +820,44 @@ async def update_student(student_id: str, request: StudentUpdateRequest) -> dict
             detail="No fields provided for update",
         )
 
-    conn = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
-
-        # Check if student exists
-        cursor.execute("SELECT ID FROM Students WHERE ID = %s", (student_id,))
-        existing = cursor.fetchone()
-
-        if not existing:
-            cursor.close()
-            conn.close()
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Student with ID {student_id} not found",
+        with db_cursor() as (conn, cursor):
+            # Execute update (columns sorted so the cached statement is reused).
+            # MSSQL counts matched rows, so 0 means the student does not exist.
+            fields = tuple(sorted(updates))
+            cursor.execute(
+                build_update_student_sql(fields),
+                (*(updates[field] for field in fields), student_id),
             )
+            rows_affected = cursor.rowcount
+            conn.commit()
 
-        # Build UPDATE query
-        set_clause = ", ".join(f"{field} = %s" for field in updates.keys())
-        update_sql = (
-            f"UPDATE Students SET {set_clause}, ModifiedDate = GETDATE() WHERE ID = %s"
-        )
-
-        # Execute update
-        cursor.execute(update_sql, (*updates.values(), student_id))
-
-        rows_affected = cursor.rowcount
-        conn.commit()
-        cursor.close()
-        conn.close()
-
-        logger.info(
-            "✅ Student updated: student_id=%s, fields=%s",
-            student_id,
-            list(updates.keys()),
-        )
-
-        return {
-            "success": True,
-            "student_id": student_id,
-            "updated_fields": list(updates.keys()),
-            "message": f"Updated {rows_affected} record(s)",
-        }
-
-    except HTTPException:
-        raise
     except Exception as e:
-        if conn:
-            conn.rollback()
-            conn.close()
         logger.error("❌ Error updating student: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to update student: {e!s}",
         ) from e
 
+    if rows_affected == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Student with ID {student_id} not found",
+        )
+
+    logger.info(
+        "✅ Student updated: student_id=%s, fields=%s",
+        student_id,
+        list(updates.keys()),
+    )
+
+    return {
+        "success": True,
+        "student_id": student_id,
+        "updated_fields": list(updates.keys()),
+        "message": f"Updated {rows_affected} record(s)",
+    }
+
 
 # DEPRECATED: CREATE endpoint disabled - legacy schema doesn't match Django assumptions
 # Original endpoint tried to insert fields like StudentCode, FirstName, LastName
@@ -461,12 +1000,8 @@ async def update_student(student_id: str, request: StudentUpdateRequest) -> dict
 #         ) from e
 
 
-@app.get(
-    "/students/{student_id}",
-    response_model=LegacyStudentRecord | None,
-    dependencies=[Depends(verify_api_key)],
-)
-async def get_student(student_id: str) -> LegacyStudentRecord | None:
+@app.get("/students/{student_id}", response_model=LegacyStudentRecord | None)
+def get_student(student_id: str) -> LegacyStudentRecord | None:
     """Retrieve student record from legacy database.
 
     🔒 Requires API key authentication
@@ -483,52 +1018,31 @@ async def get_student(student_id: str) -> LegacyStudentRecord | None:
     """
     logger.info("🔍 Fetching student: student_id=%s", student_id)
 
-    conn = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor(as_dict=True)
-
-        # Query actual legacy schema fields
-        cursor.execute(
-            """
-            SELECT
-                ID, Name, KName, BirthDate, BirthPlace, Gender,
-                Email, MobilePhone, HomePhone, HomeAddress,
-                Status, Admitted, Deleted,
-                AdmissionDate, AdmissionDateForUnder, AdmissionDateForMaster,
-                SelectedProgram, SelectedMajor, SelectedFaculty,
-                Firstenroll, Lastenroll,
-                BAStartDate, BAEndDate, MAStartDate, MAEndDate,
-                Transfer, CreatedDate, ModifiedDate
-            FROM Students
-            WHERE ID = %s
-            """,
-            (student_id,),
-        )
-
-        result = cursor.fetchone()
-        cursor.close()
-        conn.close()
+        with db_cursor(as_dict=True) as (_conn, cursor):
+            # Query actual legacy schema fields
+            cursor.execute(GET_STUDENT_SQL, (student_id,))
+            result = cursor.fetchone()
 
-        if not result:
-            logger.warning("⚠️  Student not found: student_id=%s", student_id)
-            return None
-
-        logger.info("✅ Student found: student_id=%s", student_id)
-        return LegacyStudentRecord(**result)
+        student = LegacyStudentRecord.model_validate(result) if result else None
 
     except Exception as e:
-        if conn:
-            conn.close()
         logger.error("❌ Error fetching student: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch student from legacy database: {e!s}",
         ) from e
 
+    if student is None:
+        logger.warning("⚠️  Student not found: student_id=%s", student_id)
+        return None
+
+    logger.info("✅ Student found: student_id=%s", student_id)
+    return student
 
-@app.delete("/students/{student_id}", dependencies=[Depends(verify_api_key)])
-async def delete_student(student_id: str) -> dict:
+
+@app.delete("/students/{student_id}")
+def delete_student(student_id: str) -> dict:
     """Soft delete student in legacy database.
 
     🔒 Requires API key authentication
@@ -548,56 +1062,42 @@ async def delete_student(student_id: str) -> dict:
     """
     logger.info("🗑️  Soft deleting student: student_id=%s", student_id)
 
-    conn = None
     try:
-        conn = get_connection()
-        cursor = conn.cursor()
+        with db_cursor() as (conn, cursor):
+            cursor.execute(SOFT_DELETE_STUDENT_SQL, (student_id,))
+            rows_affected = cursor.rowcount
+            conn.commit()
 
-        cursor.execute(
-            "UPDATE Students SET Status = 'Inactive' WHERE ID = %s",
-            (student_id,),
-        )
-
-        rows_affected = cursor.rowcount
-        conn.commit()
-        cursor.close()
-        conn.close()
-
-        if rows_affected == 0:
-            logger.warning(
-                "⚠️  Student not found for deletion: student_id=%s", student_id
-            )
-            raise HTTPException(
-                status_code=status.HTTP_404_NOT_FOUND,
-                detail=f"Student with student_id {student_id} not found",
-            )
-
-        logger.info("✅ Student soft deleted: student_id=%s", student_id)
-        return {"success": True, "message": "Student marked as inactive"}
-
-    except HTTPException:
-        raise
     except Exception as e:
-        if conn:
-            conn.rollback()
-            conn.close()
         logger.error("❌ Error soft deleting student: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to delete student: {e!s}",
         ) from e
 
+    if rows_affected == 0:
+        logger.warning("⚠️  Student not found for deletion: student_id=%s", student_id)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Student with student_id {student_id} not found",
+        )
+
+    logger.info("✅ Student soft deleted: student_id=%s", student_id)
+    return {"success": True, "message": "Student marked as inactive"}
 
-@app.get(
-    "/enrollments",
-    response_model=list[LegacyEnrollment],
-    dependencies=[Depends(verify_api_key)],
-)
-async def get_enrollments(
+
+@app.get("/enrollments", response_model=list[LegacyEnrollment])
+def get_enrollments(
     term: str | None = None,
     course: str | None = None,
     student: str | None = None,
-) -> list[LegacyEnrollment]:
+    stream: bool = False,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    *,
+    request: Request,
+    response: Response,
+) -> list[LegacyEnrollment] | Response:
     """Retrieve enrollment records from legacy AcademicCourseTakers table.
 
     🔒 Requires API key authentication
@@ -611,19 +1111,29 @@ async def get_enrollments(
         term: Filter by term (ClassID prefix, e.g., "251027E-T4BE")
         course: Filter by course code (e.g., "EHSS-02")
         student: Filter by student ID
+        stream: Stream all records as NDJSON instead of one JSON array
+            (cannot be combined with limit or offset)
+        limit: Page size, at most 5000 (omit limit and offset for all records)
+        offset: Records to skip (pages of 500 when limit is omitted)
+        request: Current request
+        response: Response used to set the pagination header
 
     Returns:
-        List of enrollment records matching filters
+        List of enrollment records matching filters (NDJSON when streaming).
+        Unpaged requests return every match; a full page carries a
+        ``Link: <...>; rel="next"`` header.
 
     Raises:
         401: Missing or invalid API key
-        422: No filters provided
+        422: No filters provided, or stream combined with limit/offset
         500: Database error
 
     Examples:
         GET /enrollments?term=251027E-T4BE
         GET /enrollments?term=251027E-T4BE&course=EHSS-02
         GET /enrollments?student=18405
+        GET /enrollments?term=251027E-T4BE&limit=1000&offset=1000
+        GET /enrollments?term=251027E-T4BE&stream=true
     """
     logger.info(
         "🔍 Fetching enrollments: term=%s, course=%s, student=%s", term, course, student
@@ -636,75 +1146,75 @@ async def get_enrollments(
             detail="At least one filter (term, course, or student) is required",
         )
 
-    conn = None
+    # Pick the prebuilt query for the provided filters, paged only on request
+    paged = limit is not None or offset > 0
+    if paged and stream:
+        # A streamed page could not carry its Link header: the row count is
+        # only known once the body has been sent
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="stream cannot be combined with limit or offset",
+        )
+    page_size = limit or DEFAULT_PAGE_SIZE
+    filters = bool(term), bool(course), bool(student)
+    query = ENROLLMENTS_PAGED_SQL[filters] if paged else ENROLLMENTS_SQL[filters]
+    params: list[str | int] = []
+
+    if term:
+        # Term is the ClassID prefix before first !$
+        params.append(f"{term}!$%")
+
+    if course:
+        # Course code filter (may need to parse from ClassID or use NormalizedCourse)
+        params.append(f"%{course}%")
+
+    if student:
+        params.append(student)
+
+    if paged:
+        params += (offset, page_size)
+
     try:
-        conn = get_connection()
-        cursor = conn.cursor(as_dict=True)
-
-        # Build WHERE clause dynamically based on provided filters
-        where_conditions = []
-        params = []
-
-        if term:
-            # Term is the ClassID prefix before first !$
-            where_conditions.append("ClassID LIKE %s")
-            params.append(f"{term}!$%")
-
-        if course:
-            # Course code filter (may need to parse from ClassID or use NormalizedCourse)
-            where_conditions.append("NormalizedCourse LIKE %s")
-            params.append(f"%{course}%")
-
-        if student:
-            where_conditions.append("ID = %s")
-            params.append(student)
-
-        where_clause = " AND ".join(where_conditions)
-
-        # Query AcademicCourseTakers table
-        query = f"""
-            SELECT
-                IPK, ID, ClassID, RepeatNum, LScore, UScore,
-                Credit, GradePoint, TotalPoint, Grade, PreviousGrade,
-                Passed, Remarks, RegisterMode, Attendance,
-                AddTime, LastUpdate,
-                NormalizedCourse, NormalizedPart, NormalizedSection
-            FROM AcademicCourseTakers
-            WHERE {where_clause}
-            ORDER BY ClassID, ID
-        """
+        with ExitStack() as stack:
+            _conn, cursor = stack.enter_context(db_cursor(as_dict=True))
+            cursor.execute(query, tuple(params))
 
-        cursor.execute(query, tuple(params))
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+            if stream:
+                # The response takes over the connection and closes it when done
+                return NDJSONStreamingResponse(
+                    stream_ndjson_rows(cursor, LegacyEnrollment), stack.pop_all()
+                )
 
-        logger.info("✅ Found %d enrollment records", len(results))
+            results = cursor.fetchall()
 
         # Convert to LegacyEnrollment models
-        return [LegacyEnrollment(**row) for row in results]
+        records = rows_to_models(LegacyEnrollment, results)
 
-    except HTTPException:
-        raise
     except Exception as e:
-        if conn:
-            conn.close()
         logger.error("❌ Error fetching enrollments: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch enrollments from legacy database: {e!s}",
         ) from e
 
+    logger.info("✅ Found %d enrollment records", len(records))
+    if paged:
+        set_next_page_link(request, response, offset, page_size, len(records))
 
-@app.get(
-    "/classes",
-    response_model=list[LegacyAcademicClass],
-    dependencies=[Depends(verify_api_key)],
-)
-async def get_classes(
+    return records
+
+
+@app.get("/classes", response_model=list[LegacyAcademicClass])
+def get_classes(
     term: str | None = None,
     course: str | None = None,
-) -> list[LegacyAcademicClass]:
+    stream: bool = False,
+    limit: int | None = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    offset: int = Query(0, ge=0),
+    *,
+    request: Request,
+    response: Response,
+) -> list[LegacyAcademicClass] | Response:
     """Retrieve class records from legacy AcademicClasses table.
 
     🔒 Requires API key authentication
@@ -717,18 +1227,28 @@ async def get_classes(
     Args:
         term: Filter by term (TermID field, e.g., "251027E-T4BE")
         course: Filter by course code (e.g., "EHSS-02")
+        stream: Stream all records as NDJSON instead of one JSON array
+            (cannot be combined with limit or offset)
+        limit: Page size, at most 5000 (omit limit and offset for all records)
+        offset: Records to skip (pages of 500 when limit is omitted)
+        request: Current request
+        response: Response used to set the pagination header
 
     Returns:
-        List of class records matching filters
+        List of class records matching filters (NDJSON when streaming).
+        Unpaged requests return every match; a full page carries a
+        ``Link: <...>; rel="next"`` header.
 
     Raises:
         401: Missing or invalid API key
-        422: No filters provided
+        422: No filters provided, or stream combined with limit/offset
         500: Database error
 
     Examples:
         GET /classes?term=251027E-T4BE
         GET /classes?term=251027E-T4BE&course=EHSS-02
+        GET /classes?term=251027E-T4BE&limit=100&offset=100
+        GET /classes?term=251027E-T4BE&stream=true
     """
     logger.info("🔍 Fetching classes: term=%s, course=%s", term, course)
 
@@ -739,54 +1259,54 @@ async def get_classes(
             detail="At least one filter (term or course) is required",
         )
 
-    conn = None
+    # Pick the prebuilt query for the provided filters, paged only on request
+    paged = limit is not None or offset > 0
+    if paged and stream:
+        # A streamed page could not carry its Link header: the row count is
+        # only known once the body has been sent
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="stream cannot be combined with limit or offset",
+        )
+    page_size = limit or DEFAULT_PAGE_SIZE
+    filters = bool(term), bool(course)
+    query = CLASSES_PAGED_SQL[filters] if paged else CLASSES_SQL[filters]
+    params: list[str | int] = []
+
+    if term:
+        params.append(term)
+
+    if course:
+        params.append(f"%{course}%")
+
+    if paged:
+        params += (offset, page_size)
+
     try:
-        conn = get_connection()
-        cursor = conn.cursor(as_dict=True)
-
-        # Build WHERE clause dynamically
-        where_conditions = []
-        params = []
-
-        if term:
-            where_conditions.append("TermID = %s")
-            params.append(term)
-
-        if course:
-            where_conditions.append("NormalizedCourse LIKE %s")
-            params.append(f"%{course}%")
-
-        where_clause = " AND ".join(where_conditions)
-
-        # Query AcademicClasses table
-        query = f"""
-            SELECT
-                IPK, TermID, Program, Major, GroupID, CourseCode, ClassID,
-                CourseTitle, StNumber, CourseType, SchoolTime, Subject,
-                NormalizedCourse, NormalizedPart, NormalizedSection, NormalizedTOD,
-                CreatedDate, ModifiedDate
-            FROM AcademicClasses
-            WHERE {where_clause}
-            ORDER BY ClassID
-        """
+        with ExitStack() as stack:
+            _conn, cursor = stack.enter_context(db_cursor(as_dict=True))
+            cursor.execute(query, tuple(params))
 
-        cursor.execute(query, tuple(params))
-        results = cursor.fetchall()
-        cursor.close()
-        conn.close()
+            if stream:
+                # The response takes over the connection and closes it when done
+                return NDJSONStreamingResponse(
+                    stream_ndjson_rows(cursor, LegacyAcademicClass), stack.pop_all()
+                )
 
-        logger.info("✅ Found %d class records", len(results))
+            results = cursor.fetchall()
 
         # Convert to LegacyAcademicClass models
-        return [LegacyAcademicClass(**row) for row in results]
+        records = rows_to_models(LegacyAcademicClass, results)
 
-    except HTTPException:
-        raise
     except Exception as e:
-        if conn:
-            conn.close()
         logger.error("❌ Error fetching classes: %s", str(e))
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=f"Failed to fetch classes from legacy database: {e!s}",
         ) from e
+
+    logger.info("✅ Found %d class records", len(records))
+    if paged:
+        set_next_page_link(request, response, offset, page_size, len(records))
+
+    return records
@@ -16,13 +16,79 @@ IMPORTANT NOTES:
 from __future__ import annotations
 
 from datetime import date
-from typing import TYPE_CHECKING, Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Final
 
 if TYPE_CHECKING:
+    from collections.abc import Mapping
+
     from .models import StudentCreateRequest
 
+# Lookup tables, built once at import and read-only. The status and study
+# time tables are public so callers and tests share one source of truth.
+
+# Django gender → legacy gender (monks are handled separately, see below)
+# Django uses: M (Male), F (Female), N (Non-binary), X (Prefer not to say)
+# Legacy uses: M (Male), F (Female), Monk (gender value, not separate field!)
+_GENDER_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "M": "M",  # Male
+        "F": "F",  # Female
+        "N": "M",  # Non-binary → default to M (legacy has no equivalent)
+        "X": "M",  # Prefer not to say → default to M (legacy has no equivalent)
+    }
+)
+
+# Legacy gender → (Django gender, is monk). Keyed by the raw values seen in
+# the legacy data so the common cases are one lookup; anything else (stray
+# whitespace, odd casing) is stripped and casefolded, then looked up again.
+_GENDER_DISPATCH: Final[Mapping[str, tuple[str, bool]]] = MappingProxyType(
+    {
+        "M": ("M", False),
+        "m": ("M", False),
+        "F": ("F", False),
+        "f": ("F", False),
+        "MONK": ("M", True),
+        "Monk": ("M", True),
+        "monk": ("M", True),
+    }
+)
 
-def django_student_to_legacy(django_student: StudentCreateRequest) -> dict[str, Any]:
+# Django uses: ACTIVE, INACTIVE, GRADUATED, etc.
+# Legacy uses: Active, Inactive, Graduated, etc. (Title Case)
+STATUS_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "ACTIVE": "Active",
+        "INACTIVE": "Inactive",
+        "GRADUATED": "Graduated",
+        "DROPPED": "Dropped",
+        "SUSPENDED": "Suspended",
+        "TRANSFERRED": "Transferred",
+        "FROZEN": "Frozen",
+        "UNKNOWN": "Unknown",
+    }
+)
+STATUS_REVERSE_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {legacy: django for django, legacy in STATUS_MAP.items()}
+)
+
+# Django uses: morning, afternoon, evening (lowercase)
+# Legacy uses: Morning, Afternoon, Evening (Title Case)
+STUDY_TIME_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "morning": "Morning",
+        "afternoon": "Afternoon",
+        "evening": "Evening",
+    }
+)
+STUDY_TIME_REVERSE_MAP: Final[Mapping[str, str]] = MappingProxyType(
+    {legacy: django for django, legacy in STUDY_TIME_MAP.items()}
+)
+
+
+def django_student_to_legacy(
+    django_student: StudentCreateRequest, *, today: date | None = None
+) -> dict[str, Any]:
     """Map Django StudentProfile + Person fields to legacy Students table schema.
 
     This function handles the impedance mismatch between Django's clean
@@ -30,6 +96,8 @@ def django_student_to_legacy(django_student: StudentCreateRequest) -> dict[str,
 
     Args:
         django_student: Student data from Django
+        today: EnrollmentDate fallback when the student has none. Defaults to
+            date.today(), looked up only when needed.
 
     Returns:
         Dictionary with legacy table column names and values
@@ -49,46 +117,16 @@ def django_student_to_legacy(django_student: StudentCreateRequest) -> dict[str,
         'M'
     """
     # Map Django gender choices to legacy values
-    # Django uses: M (Male), F (Female), N (Non-binary), X (Prefer not to say)
     # Django also has separate is_monk field (boolean)
-    # Legacy uses: M (Male), F (Female), Monk (gender value, not separate field!)
     #
     # Mapping strategy:
     # - If is_monk=True → use "Monk" as gender in legacy (regardless of actual gender)
     # - Otherwise use standard gender mapping
-    if django_student.is_monk:
-        legacy_gender = "Monk"
-    else:
-        gender_map = {
-            "M": "M",  # Male
-            "F": "F",  # Female
-            "N": "M",  # Non-binary → default to M (legacy has no equivalent)
-            "X": "M",  # Prefer not to say → default to M (legacy has no equivalent)
-        }
-        legacy_gender = gender_map.get(django_student.gender, "M")
-
-    # Map Django status to legacy status
-    # Django uses: ACTIVE, INACTIVE, GRADUATED, etc.
-    # Legacy uses: Active, Inactive, Graduated, etc. (Title Case)
-    status_map = {
-        "ACTIVE": "Active",
-        "INACTIVE": "Inactive",
-        "GRADUATED": "Graduated",
-        "DROPPED": "Dropped",
-        "SUSPENDED": "Suspended",
-        "TRANSFERRED": "Transferred",
-        "FROZEN": "Frozen",
-        "UNKNOWN": "Unknown",
-    }
-
-    # Map study time preferences
-    # Django uses: morning, afternoon, evening (lowercase)
-    # Legacy uses: Morning, Afternoon, Evening (Title Case)
-    study_time_map = {
-        "morning": "Morning",
-        "afternoon": "Afternoon",
-        "evening": "Evening",
-    }
+    legacy_gender = (
+        "Monk"
+        if django_student.is_monk
+        else _GENDER_MAP.get(django_student.gender, "M")
+    )
 
     return {
         # Primary identifier - Django-generated student_id is source of truth!
@@ -106,12 +144,12 @@ def django_student_to_legacy(django_student: StudentCreateRequest) -> dict[str,
         "Email": django_student.email,
         "PhoneNumber": django_student.phone_number,
         # Enrollment information
-        "EnrollmentDate": django_student.enrollment_date or date.today(),
-        "Status": status_map.get(django_student.status, "Unknown"),
+        "EnrollmentDate": django_student.enrollment_date or today or date.today(),
+        "Status": STATUS_MAP.get(django_student.status, "Unknown"),
         # Student-specific attributes
         "IsMonk": django_student.is_monk,
         "PreferredStudyTime": (
-            study_time_map.get(django_student.preferred_study_time)
+            STUDY_TIME_MAP.get(django_student.preferred_study_time)
             if django_student.preferred_study_time
             else None
         ),
@@ -135,47 +173,19 @@ def legacy_student_to_django(legacy_record: dict[str, Any]) -> dict[str, Any]:
     # WARNING: Legacy data is inconsistent! Could be "Monk", "monk", "MONK"
     # Django uses: M (Male), F (Female), N (Non-binary), X (Prefer not to say)
     # Django also has separate is_monk boolean field
-    legacy_gender = str(legacy_record.get("Gender", "M")).strip()
-
-    if legacy_gender.upper() == "MONK":
-        # Monk in legacy (any casing) → is_monk=True, gender defaults to M
-        django_gender = "M"
-        is_monk = True
-    else:
-        # Normalize to uppercase for comparison
-        gender_upper = legacy_gender.upper()
-        gender_reverse_map = {
-            "M": "M",
-            "F": "F",
-        }
-        django_gender = gender_reverse_map.get(gender_upper, "M")
+    legacy_gender = legacy_record.get("Gender", "M")
+    dispatch = _GENDER_DISPATCH.get(legacy_gender)
+    if dispatch is None:
+        dispatch = _GENDER_DISPATCH.get(
+            str(legacy_gender).strip().casefold(), ("M", False)
+        )
+
+    # Monk in legacy (any casing) → is_monk=True, gender defaults to M
+    django_gender, is_monk = dispatch
+    if not is_monk:
         # is_monk is stored in separate IsMonk field (if present)
         is_monk = legacy_record.get("IsMonk", False)
 
-    # Reverse status mapping
-    status_reverse_map = {
-        "Active": "ACTIVE",
-        "Inactive": "INACTIVE",
-        "Graduated": "GRADUATED",
-        "Dropped": "DROPPED",
-        "Suspended": "SUSPENDED",
-        "Transferred": "TRANSFERRED",
-        "Frozen": "FROZEN",
-        "Unknown": "UNKNOWN",
-    }
-
-    # Reverse study time mapping
-    study_time_reverse_map = {
-        "Morning": "morning",
-        "Afternoon": "afternoon",
-        "Evening": "evening",
-    }
-
-    # Get status value with default
-    status_value = legacy_record.get("Status")
-    if status_value is None:
-        status_value = "Unknown"
-
     return {
         "student_id": legacy_record.get("StudentCode"),
         "legacy_student_id": legacy_record.get("StudentID"),
@@ -189,9 +199,10 @@ def legacy_student_to_django(legacy_record: dict[str, Any]) -> dict[str, Any]:
         "email": legacy_record.get("Email"),
         "phone_number": legacy_record.get("PhoneNumber"),
         "enrollment_date": legacy_record.get("EnrollmentDate"),
-        "status": status_reverse_map.get(status_value, "UNKNOWN"),
+        # Missing (None) or unrecognised status → UNKNOWN
+        "status": STATUS_REVERSE_MAP.get(legacy_record.get("Status"), "UNKNOWN"),
         "is_monk": is_monk,  # Extracted from Gender="Monk" or IsMonk field
-        "preferred_study_time": study_time_reverse_map.get(
+        "preferred_study_time": STUDY_TIME_REVERSE_MAP.get(
             legacy_record.get("PreferredStudyTime")
         ),
         "is_transfer_student": legacy_record.get("IsTransferStudent", False),
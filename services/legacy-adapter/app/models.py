@@ -2,7 +2,11 @@
 
 from datetime import date, datetime
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
+
+# Request and row models are never mutated after validation, so they are
+# frozen. Unknown keys are dropped rather than stored per instance.
+FROZEN_CONFIG = ConfigDict(frozen=True, extra="ignore")
 
 
 class StudentCreateRequest(BaseModel):
@@ -35,8 +39,10 @@ class StudentCreateRequest(BaseModel):
     status: str = "ACTIVE"
     enrollment_date: date | None = None
 
-    model_config = {
-        "json_schema_extra": {
+    model_config = ConfigDict(
+        frozen=True,
+        extra="ignore",
+        json_schema_extra={
             "examples": [
                 {
                     "student_id": 12345,
@@ -56,8 +62,8 @@ class StudentCreateRequest(BaseModel):
                     "enrollment_date": "2024-01-10",
                 }
             ]
-        }
-    }
+        },
+    )
 
 
 class StudentCreateResponse(BaseModel):
@@ -70,6 +76,8 @@ class StudentCreateResponse(BaseModel):
     )
     message: str
 
+    model_config = FROZEN_CONFIG
+
 
 class LegacyStudentRecord(BaseModel):
     """Legacy database student record - matches actual MSSQL schema.
@@ -121,6 +129,8 @@ class LegacyStudentRecord(BaseModel):
     CreatedDate: datetime | None = None
     ModifiedDate: datetime | None = None
 
+    model_config = FROZEN_CONFIG
+
 
 class LegacyAcademicClass(BaseModel):
     """Legacy database academic class record."""
@@ -144,6 +154,8 @@ class LegacyAcademicClass(BaseModel):
     CreatedDate: datetime | None = None
     ModifiedDate: datetime | None = None
 
+    model_config = FROZEN_CONFIG
+
 
 class LegacyEnrollment(BaseModel):
     """Legacy database academic course taker (enrollment) record."""
@@ -169,6 +181,8 @@ class LegacyEnrollment(BaseModel):
     NormalizedPart: str | None = None
     NormalizedSection: str | None = None
 
+    model_config = FROZEN_CONFIG
+
 
 class StudentUpdateRequest(BaseModel):
     """Request model for updating student fields in legacy database.
@@ -192,6 +206,8 @@ class StudentUpdateRequest(BaseModel):
     SelectedFaculty: str | None = None
     Transfer: str | None = None
 
+    model_config = FROZEN_CONFIG
+
 
 class ErrorResponse(BaseModel):
     """Standard error response model."""
@@ -199,6 +215,8 @@ class ErrorResponse(BaseModel):
     detail: str
     timestamp: str | None = None
 
+    model_config = FROZEN_CONFIG
+
 
 class HealthCheckResponse(BaseModel):
     """Health check response model."""
@@ -207,3 +225,5 @@ class HealthCheckResponse(BaseModel):
     database: str
     timestamp: str
     version: str = "1.0.0"
+
+    model_config = FROZEN_CONFIG
@@ -0,0 +1,121 @@
+"""Shared rate limiting backed by Redis.
+
+The in-memory limiter in ``main.py`` is per process, so running several
+uvicorn workers or containers multiplies the effective limit. When
+``REDIS_URL`` is configured, requests are counted in a Redis sorted set
+instead, with the trim, count and insert done atomically by one Lua script.
+
+Redis is optional: ``redis`` is imported lazily, and any Redis failure
+opens a short circuit breaker during which callers fall back to the
+in-memory limiter.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+import uuid
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Rolling one-minute window over a sorted set scored by request time (ms).
+# Returns 1 when the request is allowed and recorded, 0 when over the limit.
+RATE_LIMIT_LUA = """
+local key = KEYS[1]
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local limit = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', key, 0, now - window)
+if redis.call('ZCARD', key) >= limit then
+    return 0
+end
+redis.call('ZADD', key, now, now .. ':' .. ARGV[4])
+redis.call('PEXPIRE', key, window)
+return 1
+"""
+
+WINDOW_MS = 60_000
+CIRCUIT_OPEN_SECONDS = 30.0
+
+
+class RedisRateLimiter:
+    """Per-IP rate limiter shared by every worker through Redis."""
+
+    def __init__(self, url: str) -> None:
+        """Initialize the limiter.
+
+        Args:
+            url: Redis connection URL (e.g. redis://localhost:6379/0)
+        """
+        self.url = url
+        self._client: Any = None
+        self._sha: str | None = None
+        self._no_script_errors: tuple[type[Exception], ...] = ()
+        self._retry_at = 0.0
+
+    async def connect(self) -> bool:
+        """Connect to Redis and load the rate limit script.
+
+        Returns:
+            True if Redis is ready, False if it is unavailable
+        """
+        try:
+            from redis import asyncio as aioredis
+            from redis.exceptions import NoScriptError
+        except ImportError:
+            logger.warning("⚠️  REDIS_URL is set but the redis package is missing")
+            return False
+
+        try:
+            self._client = aioredis.from_url(self.url)
+            self._sha = await self._client.script_load(RATE_LIMIT_LUA)
+        except Exception as e:
+            logger.warning("⚠️  Redis unavailable for rate limiting: %s", str(e))
+            self._client = None
+            return False
+
+        self._no_script_errors = (NoScriptError,)
+        return True
+
+    async def allow(self, ip: str, limit: int) -> bool | None:
+        """Record a request for ``ip`` and check it against the limit.
+
+        Args:
+            ip: Client IP address
+            limit: Maximum requests per minute
+
+        Returns:
+            True if under limit, False if exceeded, or None when Redis cannot
+            be used and the caller should fall back to the in-memory limiter
+        """
+        if self._client is None or time.monotonic() < self._retry_at:
+            return None
+
+        args = (
+            f"rl:{ip}",
+            int(time.time() * 1000),
+            WINDOW_MS,
+            limit,
+            uuid.uuid4().hex,
+        )
+        try:
+            try:
+                allowed = await self._client.evalsha(self._sha, 1, *args)
+            except self._no_script_errors:
+                # Script cache was flushed (restart, failover, SCRIPT FLUSH)
+                logger.warning("⚠️  Rate limit script missing in Redis, reloading")
+                self._sha = await self._client.script_load(RATE_LIMIT_LUA)
+                allowed = await self._client.evalsha(self._sha, 1, *args)
+        except Exception as e:
+            logger.error("❌ Redis rate limit check failed: %s", str(e))
+            self._retry_at = time.monotonic() + CIRCUIT_OPEN_SECONDS
+            return None
+
+        return bool(allowed)
+
+    async def close(self) -> None:
+        """Close the Redis connection."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
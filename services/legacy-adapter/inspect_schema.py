@@ -13,7 +13,7 @@ from app.database import get_connection
 def inspect_table(table_name: str):
     """Get schema information for a table."""
     conn = get_connection()
-    cursor = conn.cursor(as_dict=True)
+    cursor = conn.cursor()
 
     print(f"\n{'=' * 80}")
     print(f"Schema for table: {table_name}")
@@ -47,22 +47,18 @@ def inspect_table(table_name: str):
     print(f"{'Column Name':<40} {'Type':<20} {'Max Length':<12} {'Nullable':<10}")
     print("-" * 85)
 
-    # Print columns
-    for col in columns:
-        col_name = col["COLUMN_NAME"]
-        data_type = col["DATA_TYPE"]
-        max_length = (
-            str(col["CHARACTER_MAXIMUM_LENGTH"])
-            if col["CHARACTER_MAXIMUM_LENGTH"]
-            else "N/A"
+    # Print columns (one write for the whole table)
+    lines = []
+    for col_name, data_type, char_max_length, nullable, _default in columns:
+        max_length = str(char_max_length) if char_max_length else "N/A"
+        lines.append(
+            f"{col_name:<40} {data_type:<20} {max_length:<12} {nullable:<10}\n"
         )
-        nullable = col["IS_NULLABLE"]
-
-        print(f"{col_name:<40} {data_type:<20} {max_length:<12} {nullable:<10}")
+    sys.stdout.write("".join(lines))
 
     # Get row count
     cursor.execute(f"SELECT COUNT(*) as count FROM {table_name}")
-    count = cursor.fetchone()["count"]
+    count = cursor.fetchone()[0]
 
     print(f"\n📊 Total Records: {count:,}")
 
@@ -73,7 +69,7 @@ def inspect_table(table_name: str):
 def list_tables():
     """List all tables in the database."""
     conn = get_connection()
-    cursor = conn.cursor(as_dict=True)
+    cursor = conn.cursor()
 
     print(f"\n{'=' * 80}")
     print("Available Tables")
@@ -88,8 +84,11 @@ def list_tables():
 
     tables = cursor.fetchall()
 
-    for idx, table in enumerate(tables, 1):
-        print(f"{idx:3}. {table['TABLE_NAME']}")
+    sys.stdout.write(
+        "".join(
+            f"{idx:3}. {table_name}\n" for idx, (table_name,) in enumerate(tables, 1)
+        )
+    )
 
     print(f"\n📊 Total Tables: {len(tables)}")
 
@@ -15,21 +15,25 @@ from typing import TYPE_CHECKING
 from unittest.mock import MagicMock, patch
 
 import pytest
-from fastapi.testclient import TestClient
-from pymssql import Connection
 
 if TYPE_CHECKING:
     from collections.abc import Generator
 
+    from fastapi.testclient import TestClient
+
 # Test configuration
 TEST_API_KEY = "test-api-key-12345"
 TEST_LEGACY_DB_HOST = "test-mssql-server"
 TEST_LEGACY_DB_NAME = "test_legacy_db"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_settings():
-    """Override settings for testing."""
+    """Override settings for testing.
+
+    Session-scoped: ``app.main`` binds ``settings`` when it is first imported,
+    which happens under this patch (see ``_app_client``).
+    """
     with patch("app.config.settings") as mock_settings:
         mock_settings.API_KEY = TEST_API_KEY
         mock_settings.LEGACY_DB_HOST = TEST_LEGACY_DB_HOST
@@ -44,12 +48,20 @@ def test_settings():
         mock_settings.RATE_LIMIT_PER_MINUTE = 60
         mock_settings.API_HOST = "0.0.0.0"
         mock_settings.API_PORT = 8000
+        mock_settings.DB_POOL_SIZE = 5
+        mock_settings.DB_POOL_MIN = 1
+        mock_settings.DB_POOL_TIMEOUT = 30.0
+        mock_settings.REDIS_URL = None
+        mock_settings.TRUSTED_PROXIES = "127.0.0.1"
         yield mock_settings
 
 
 @pytest.fixture
 def mock_db_connection() -> Generator[MagicMock]:
     """Mock pymssql database connection."""
+    # Imported here so mapper/unit-only runs skip loading the driver
+    from pymssql import Connection
+
     mock_conn = MagicMock(spec=Connection)
     mock_cursor = MagicMock()
 
@@ -67,24 +79,55 @@ def mock_db_connection() -> Generator[MagicMock]:
 
 
 @pytest.fixture
-def client(test_settings, mock_db_connection) -> Generator[TestClient]:
+def mock_cursor(mock_db_connection) -> MagicMock:
+    """Cursor returned by every ``mock_db_connection.cursor()`` call.
+
+    Tests configure results on it directly, e.g.
+    ``mock_cursor.fetchone.side_effect = [None, [999]]``.
+    """
+    return mock_db_connection.cursor.return_value
+
+
+@pytest.fixture(scope="session")
+def _app_client(test_settings) -> Generator[TestClient]:
+    """TestClient shared by the whole session.
+
+    Building the client and running the app lifespan once, rather than per
+    test, keeps the API tests fast. The pool functions are only patched while
+    the lifespan starts and stops, so database tests still see the real ones.
+    """
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    test_client = TestClient(app)
+    with (
+        patch("app.main.init_connection_pool"),
+        patch("app.main.close_connection_pool"),
+    ):
+        test_client.__enter__()
+    yield test_client
+    with (
+        patch("app.main.init_connection_pool"),
+        patch("app.main.close_connection_pool"),
+    ):
+        test_client.__exit__(None, None, None)
+
+
+@pytest.fixture
+def client(_app_client, mock_db_connection) -> Generator[TestClient]:
     """FastAPI test client with mocked database.
 
     This fixture provides a test client with:
-    - Mocked database connections
+    - Mocked database connections (a fresh mock per test)
     - Test API key configured
-    - Lifespan events disabled for faster tests
+    - Health check caching disabled
     """
-    # Patch database connection before importing app
     with (
         patch("app.database.get_connection", return_value=mock_db_connection),
-        patch("app.database.init_connection_pool"),
-        patch("app.database.close_connection_pool"),
+        patch("app.main.HEALTH_CACHE_TTL", 0.0),
     ):
-        from app.main import app
-
-        with TestClient(app) as test_client:
-            yield test_client
+        yield _app_client
 
 
 @pytest.fixture
@@ -6,6 +6,12 @@ including authentication, validation, error handling, and database operations.
 
 from __future__ import annotations
 
+import json
+import logging
+import threading
+from collections import deque
+from unittest.mock import MagicMock, patch
+
 import pytest
 from fastapi import status
 
@@ -14,10 +20,9 @@ from fastapi import status
 class TestHealthEndpoint:
     """Test health check endpoint."""
 
-    def test_health_check_success(self, client, mock_db_connection):
+    def test_health_check_success(self, client, mock_cursor):
         """Test health check returns healthy status when DB is accessible."""
         # Configure mock to return successful query
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.return_value = [1]
 
         response = client.get("/health")
@@ -29,9 +34,8 @@ class TestHealthEndpoint:
         assert "timestamp" in data
         assert data["version"] == "1.0.0"
 
-    def test_health_check_no_auth_required(self, client, mock_db_connection):
+    def test_health_check_no_auth_required(self, client, mock_cursor):
         """Test health check works without authentication."""
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.return_value = [1]
 
         # No API key header
@@ -52,17 +56,89 @@ class TestHealthEndpoint:
         assert data["database"] == "disconnected"
         assert "error" in data
 
+    def test_health_check_result_is_cached(self, client, mock_db_connection):
+        """Test repeated polls within the TTL reuse the last database probe."""
+        from app import main
+
+        main._health_cache = None
+        with patch.object(main, "HEALTH_CACHE_TTL", 60.0):
+            for _ in range(3):
+                assert client.get("/health").status_code == status.HTTP_200_OK
+
+        assert mock_db_connection.cursor.call_count == 1
+
+    def test_access_log_is_json(self, client, auth_headers, caplog):
+        """Test each request is logged as one JSON object on the access logger."""
+        with caplog.at_level(logging.INFO, logger="access"):
+            client.get("/students/12345", headers=auth_headers)
+
+        records = [r for r in caplog.records if r.name == "access"]
+        assert len(records) == 1
+        entry = json.loads(records[0].getMessage())
+        assert entry["method"] == "GET"
+        assert entry["path"] == "/students/12345"
+        assert entry["status"] == status.HTTP_200_OK
+        assert entry["duration_ms"] >= 0
+        assert entry["ip"] == "testclient"
+
+    def test_request_id_generated_and_logged(self, client, auth_headers, caplog):
+        """Test a request without X-Request-ID gets one echoed and on its logs."""
+        with caplog.at_level(logging.INFO, logger="access"):
+            response = client.get("/students/12345", headers=auth_headers)
+
+        request_id = response.headers["x-request-id"]
+        assert len(request_id) == 32
+        access = [r for r in caplog.records if r.name == "access"]
+        assert access[0].request_id == request_id
+
+    def test_request_id_propagated(self, client, auth_headers):
+        """Test a well-formed incoming X-Request-ID is reused, a bad one replaced."""
+        response = client.get(
+            "/health", headers={**auth_headers, "X-Request-ID": "req-42"}
+        )
+        assert response.headers["x-request-id"] == "req-42"
+
+        response = client.get("/health", headers={"X-Request-ID": "bad id\n"})
+        assert response.headers["x-request-id"] != "bad id\n"
+
+    def test_forwarded_client_ip_only_from_trusted_proxy(
+        self, client, auth_headers, caplog
+    ):
+        """Test X-Forwarded-For is ignored unless the peer is a trusted proxy."""
+        headers = {**auth_headers, "X-Forwarded-For": "203.0.113.7"}
+
+        with caplog.at_level(logging.INFO, logger="access"):
+            client.get("/students/12345", headers=headers)
+
+        access = [r for r in caplog.records if r.name == "access"]
+        assert json.loads(access[0].getMessage())["ip"] == "testclient"
+
+    def test_json_response_matches_starlette_output(self, client):
+        """Test the Rust-rendered response body is byte-identical to JSONResponse."""
+        from fastapi.responses import JSONResponse
+
+        from app.main import FastJSONResponse
+
+        content = {"Name": "សុភ័ក្ត្រ", "Credit": 3, "GradePoint": 3.5, "Grade": None}
+
+        assert FastJSONResponse(content).body == JSONResponse(content).body
+        assert FastJSONResponse({"LScore": float("nan")}).body == b'{"LScore":null}'
+
 
 @pytest.mark.integration
 class TestStudentCreation:
     """Test POST /students endpoint."""
 
     def test_create_student_success(
-        self, client, auth_headers, mock_db_connection, sample_student_request
+        self,
+        client,
+        auth_headers,
+        mock_db_connection,
+        mock_cursor,
+        sample_student_request,
     ):
         """Test successful student creation."""
         # Configure mock to return no existing student, then successful insert
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.side_effect = [
             None,  # Check for existing - not found
             [999],  # SELECT @@IDENTITY - return generated ID
@@ -84,30 +160,16 @@ class TestStudentCreation:
         assert mock_db_connection.commit.called
         assert mock_cursor.close.called
 
-    def test_create_student_unauthenticated(self, client, sample_student_request):
-        """Test student creation fails without API key."""
-        response = client.post("/students", json=sample_student_request)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        data = response.json()
-        assert "api key" in data["detail"].lower()
-
-    def test_create_student_invalid_api_key(
-        self, client, invalid_auth_headers, sample_student_request
-    ):
-        """Test student creation fails with invalid API key."""
-        response = client.post(
-            "/students", json=sample_student_request, headers=invalid_auth_headers
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_create_student_duplicate(
-        self, client, auth_headers, mock_db_connection, sample_student_request
+        self,
+        client,
+        auth_headers,
+        mock_db_connection,
+        mock_cursor,
+        sample_student_request,
     ):
         """Test creating duplicate student returns 409 conflict."""
         # Configure mock to return existing student
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.return_value = [999]  # Existing StudentID
 
         response = client.post(
@@ -149,10 +211,9 @@ class TestStudentCreation:
         assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
 
     def test_create_monk_student(
-        self, client, auth_headers, mock_db_connection, sample_monk_request
+        self, client, auth_headers, mock_cursor, sample_monk_request
     ):
         """Test creating monk student with is_monk=True."""
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.side_effect = [None, [888]]
 
         response = client.post(
@@ -171,11 +232,15 @@ class TestStudentCreation:
         assert insert_params[7] == "Monk"
 
     def test_create_student_database_error(
-        self, client, auth_headers, mock_db_connection, sample_student_request
+        self,
+        client,
+        auth_headers,
+        mock_db_connection,
+        mock_cursor,
+        sample_student_request,
     ):
         """Test database error returns 500."""
         # Configure mock to raise exception on execute
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.execute.side_effect = Exception("Database connection lost")
 
         response = client.post(
@@ -191,11 +256,10 @@ class TestStudentRetrieval:
     """Test GET /students/{student_id} endpoint."""
 
     def test_get_student_success(
-        self, client, auth_headers, mock_db_connection, sample_legacy_record
+        self, client, auth_headers, mock_cursor, sample_legacy_record
     ):
         """Test successful student retrieval."""
         # Configure mock to return student record
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.return_value = sample_legacy_record
 
         response = client.get("/students/12345", headers=auth_headers)
@@ -207,10 +271,9 @@ class TestStudentRetrieval:
         assert data["LastName"] == "Chan"
         assert data["Gender"] == "M"
 
-    def test_get_student_not_found(self, client, auth_headers, mock_db_connection):
+    def test_get_student_not_found(self, client, auth_headers, mock_cursor):
         """Test retrieving non-existent student returns None."""
         # Configure mock to return None
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.return_value = None
 
         response = client.get("/students/99999", headers=auth_headers)
@@ -219,23 +282,10 @@ class TestStudentRetrieval:
         # Depending on FastAPI version, this might be 200 with null or 204
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_204_NO_CONTENT]
 
-    def test_get_student_unauthenticated(self, client):
-        """Test get student fails without API key."""
-        response = client.get("/students/12345")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_get_student_invalid_api_key(self, client, invalid_auth_headers):
-        """Test get student fails with invalid API key."""
-        response = client.get("/students/12345", headers=invalid_auth_headers)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_get_monk_student(
-        self, client, auth_headers, mock_db_connection, sample_legacy_monk_record
+        self, client, auth_headers, mock_cursor, sample_legacy_monk_record
     ):
         """Test retrieving monk student with Gender='Monk'."""
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.return_value = sample_legacy_monk_record
 
         response = client.get("/students/67890", headers=auth_headers)
@@ -245,24 +295,318 @@ class TestStudentRetrieval:
         assert data["Gender"] == "Monk"
         assert data["IsMonk"] is True
 
-    def test_get_student_database_error(self, client, auth_headers, mock_db_connection):
+    def test_get_student_database_error(self, client, auth_headers, mock_cursor):
         """Test database error returns 500."""
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.execute.side_effect = Exception("Query timeout")
 
         response = client.get("/students/12345", headers=auth_headers)
 
         assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
 
+    def test_get_student_invalid_row(self, client, auth_headers, mock_cursor):
+        """Test a malformed legacy row returns a JSON 500 instead of crashing."""
+        mock_cursor.fetchone.return_value = {"ID": None, "Admitted": "yes"}
+
+        response = client.get("/students/12345", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert "Failed to fetch student" in response.json()["detail"]
+
+
+@pytest.mark.integration
+class TestStudentUpdate:
+    """Test student update endpoint."""
+
+    def test_update_student_success(
+        self, client, auth_headers, mock_db_connection, mock_cursor
+    ):
+        """Test update binds values in the same order as the cached SET clause."""
+        mock_cursor.rowcount = 1
+
+        response = client.put(
+            "/students/12345",
+            json={"Status": "Active", "Email": "a@example.com"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        sql, params = mock_cursor.execute.call_args.args
+        assert sql == (
+            "UPDATE Students SET Email = %s, Status = %s, "
+            "ModifiedDate = GETDATE() WHERE ID = %s"
+        )
+        assert params == ("a@example.com", "Active", "12345")
+        assert mock_cursor.execute.call_count == 1
+        assert mock_db_connection.commit.called
+
+    def test_update_student_not_found(self, client, auth_headers, mock_db_connection):
+        """Test updating a missing student returns 404."""
+        response = client.put(
+            "/students/99999", json={"Status": "Active"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_update_sql_rejects_unknown_column(self, test_settings):
+        """Test the SQL builder refuses names outside StudentUpdateRequest."""
+        from app import main
+
+        with pytest.raises(ValueError, match="Students; --"):
+            main.build_update_student_sql(("Name", "Students; --"))
+
+
+@pytest.mark.integration
+class TestEnrollments:
+    """Test enrollment listing endpoint."""
+
+    def test_stream_enrollments_ndjson(
+        self, client, auth_headers, mock_db_connection, mock_cursor
+    ):
+        """Test stream=true returns one JSON object per line, page by page."""
+        mock_cursor.fetchmany.side_effect = [
+            [{"IPK": 1, "ID": "18405"}, {"IPK": 2, "ID": "18406"}],
+            [{"IPK": 3, "ID": "18407"}],
+            [],
+        ]
+
+        response = client.get(
+            "/enrollments",
+            params={"student": "18405", "stream": "true"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        lines = [json.loads(line) for line in response.text.splitlines()]
+        assert [line["IPK"] for line in lines] == [1, 2, 3]
+        assert not mock_cursor.fetchall.called
+        assert mock_db_connection.close.called
+
+    async def test_stream_releases_connection_on_disconnect(self, test_settings):
+        """Test a client disconnect closes the row generator and connection."""
+        from contextlib import ExitStack
+
+        from starlette.requests import ClientDisconnect
+
+        from app import main
+        from app.models import LegacyEnrollment
+
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = [[{"IPK": 1}], [{"IPK": 2}], []]
+        release = MagicMock()
+        resources = ExitStack()
+        resources.callback(release)
+        rows = main.stream_ndjson_rows(cursor, LegacyEnrollment)
+
+        async def send(message):
+            if message["type"] == "http.response.body":
+                raise OSError("client went away")
+
+        response = main.NDJSONStreamingResponse(rows, resources)
+        scope = {"type": "http", "asgi": {"spec_version": "2.4"}}
+        with pytest.raises(ClientDisconnect):
+            await response(scope, MagicMock(), send)
+
+        assert release.called
+        assert rows.gi_frame is None  # generator closed, not left suspended
+        assert cursor.fetchmany.call_count == 1
+
+    def test_stream_release_waits_for_in_flight_fetch(self, test_settings):
+        """Test releasing a stream waits for a fetch running on another thread."""
+        from contextlib import ExitStack
+
+        from app import main
+        from app.models import LegacyEnrollment
+
+        fetching = threading.Event()
+        resume = threading.Event()
+
+        def slow_fetchmany(size):
+            fetching.set()
+            resume.wait(5)
+            return [{"IPK": 1}]
+
+        cursor = MagicMock()
+        cursor.fetchmany.side_effect = slow_fetchmany
+        release = MagicMock()
+        resources = ExitStack()
+        resources.callback(release)
+        response = main.NDJSONStreamingResponse(
+            main.stream_ndjson_rows(cursor, LegacyEnrollment), resources
+        )
+        chunks = response._guarded_rows()
+
+        reader = threading.Thread(target=next, args=(chunks,))
+        reader.start()
+        assert fetching.wait(5)
+        releaser = threading.Thread(target=response._release)
+        releaser.start()
+        releaser.join(0.05)
+
+        assert releaser.is_alive()
+        assert not release.called
+
+        resume.set()
+        reader.join(5)
+        releaser.join(5)
+
+        assert release.called
+        assert next(chunks, None) is None
+        assert cursor.fetchmany.call_count == 1
+
+    @pytest.mark.parametrize(
+        ("pages", "expected_pooled"),
+        [
+            ([[{"IPK": 1}], []], 1),  # ran to the last row
+            ([[{"IPK": 1}], OSError("connection reset")], 0),  # fetch failed
+            ([[{"IPK": 1}], [{"IPK": "bad"}]], 0),  # row failed validation
+            ([[{"IPK": 1}], [{"IPK": 2}], []], 0),  # client left with rows unread
+        ],
+    )
+    def test_unfinished_stream_discards_connection(
+        self, test_settings, pages, expected_pooled
+    ):
+        """Test only a stream that ran to its last row returns its connection."""
+        from contextlib import ExitStack, suppress
+
+        from app import database, main
+        from app.models import LegacyEnrollment
+
+        raw_conn = MagicMock()
+        raw_conn.cursor.return_value.fetchmany.side_effect = pages
+        database.close_connection_pool()
+        with patch("app.database.pymssql.connect", return_value=raw_conn):
+            resources = ExitStack()
+            _conn, cursor = resources.enter_context(database.db_cursor(as_dict=True))
+        response = main.NDJSONStreamingResponse(
+            main.stream_ndjson_rows(cursor, LegacyEnrollment), resources
+        )
+
+        chunks = response._guarded_rows()
+        for _ in range(2):
+            with suppress(OSError, ValueError):
+                next(chunks, None)
+        response._release()
+
+        assert database._pool.qsize() == expected_pooled
+        assert raw_conn.rollback.called is (expected_pooled == 0)
+        assert raw_conn.close.called is (expected_pooled == 0)
+        database.close_connection_pool()
+
+    def test_enrollment_filters_select_prebuilt_query(
+        self, client, auth_headers, mock_db_connection
+    ):
+        """Test term + student filters use the matching WHERE clause and params."""
+        response = client.get(
+            "/enrollments",
+            params={"term": "251027E-T4BE", "student": "18405"},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        sql, params = mock_db_connection.cursor.return_value.execute.call_args.args
+        assert "WHERE ClassID LIKE %s AND ID = %s" in sql
+        assert params == ("251027E-T4BE!$%", "18405")
+
+    def test_unpaged_request_returns_all_rows(self, client, auth_headers, mock_cursor):
+        """Test requests without limit or offset are not truncated or linked."""
+        mock_cursor.fetchall.return_value = [{"IPK": n} for n in range(600)]
+
+        response = client.get(
+            "/classes", params={"term": "251027E-T4BE"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.json()) == 600
+        sql, params = mock_cursor.execute.call_args.args
+        assert "OFFSET" not in sql
+        assert params == ("251027E-T4BE",)
+        assert "link" not in response.headers
+
+    def test_offset_alone_uses_default_page_size(
+        self, client, auth_headers, mock_cursor
+    ):
+        """Test an offset without a limit pages with the default size."""
+        response = client.get(
+            "/classes",
+            params={"term": "251027E-T4BE", "offset": 500},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        sql, params = mock_cursor.execute.call_args.args
+        assert "ORDER BY ClassID, IPK" in sql  # unique key keeps paging stable
+        assert "OFFSET %s ROWS FETCH NEXT %s ROWS ONLY" in sql
+        assert params == ("251027E-T4BE", 500, 500)
+
+    @pytest.mark.parametrize("endpoint", ["/enrollments", "/classes"])
+    @pytest.mark.parametrize("page", [{"limit": 100}, {"offset": 500}])
+    def test_stream_rejects_paging(
+        self, client, auth_headers, mock_cursor, endpoint, page
+    ):
+        """Test stream=true with limit or offset is rejected, not sent unlinked."""
+        response = client.get(
+            endpoint,
+            params={"term": "251027E-T4BE", "stream": "true", **page},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+        assert not mock_cursor.execute.called
+
+    def test_full_page_links_to_next_page(self, client, auth_headers, mock_cursor):
+        """Test a page filled to the limit advertises the next offset."""
+        mock_cursor.fetchall.return_value = [{"IPK": 1}, {"IPK": 2}]
+
+        response = client.get(
+            "/enrollments",
+            params={"term": "251027E-T4BE", "limit": 2, "offset": 4},
+            headers=auth_headers,
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        sql, params = mock_cursor.execute.call_args.args
+        assert "ORDER BY ClassID, ID, IPK" in sql
+        assert params[-2:] == (4, 2)
+        assert "offset=6" in response.headers["link"]
+        assert response.headers["link"].endswith('rel="next"')
+
+    def test_row_types_are_coerced(self, client, auth_headers, mock_cursor):
+        """Test driver types are coerced to the response model's field types."""
+        from decimal import Decimal
+
+        mock_cursor.fetchall.return_value = [{"IPK": "7", "LScore": Decimal("7.5")}]
+
+        response = client.get(
+            "/enrollments", params={"student": "18405"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        record = response.json()[0]
+        assert record["IPK"] == 7
+        assert record["LScore"] == 7.5
+
+    def test_invalid_row_returns_500(self, client, auth_headers, mock_cursor):
+        """Test a row that fails model validation returns a JSON 500."""
+        mock_cursor.fetchall.return_value = [{"IPK": "not-a-number"}]
+
+        response = client.get(
+            "/enrollments", params={"student": "18405"}, headers=auth_headers
+        )
+
+        assert response.status_code == status.HTTP_500_INTERNAL_SERVER_ERROR
+        assert "Failed to fetch enrollments" in response.json()["detail"]
+
 
 @pytest.mark.integration
 class TestStudentDeletion:
     """Test DELETE /students/{student_id} endpoint."""
 
-    def test_delete_student_success(self, client, auth_headers, mock_db_connection):
+    def test_delete_student_success(
+        self, client, auth_headers, mock_db_connection, mock_cursor
+    ):
         """Test successful student soft deletion."""
         # Configure mock to show 1 row updated
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.rowcount = 1
 
         response = client.delete("/students/12345", headers=auth_headers)
@@ -276,10 +620,9 @@ class TestStudentDeletion:
         assert mock_cursor.execute.called
         assert mock_db_connection.commit.called
 
-    def test_delete_student_not_found(self, client, auth_headers, mock_db_connection):
+    def test_delete_student_not_found(self, client, auth_headers, mock_cursor):
         """Test deleting non-existent student returns 404."""
         # Configure mock to show 0 rows updated
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.rowcount = 0
 
         response = client.delete("/students/99999", headers=auth_headers)
@@ -288,23 +631,10 @@ class TestStudentDeletion:
         data = response.json()
         assert "not found" in data["detail"].lower()
 
-    def test_delete_student_unauthenticated(self, client):
-        """Test delete student fails without API key."""
-        response = client.delete("/students/12345")
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
-    def test_delete_student_invalid_api_key(self, client, invalid_auth_headers):
-        """Test delete student fails with invalid API key."""
-        response = client.delete("/students/12345", headers=invalid_auth_headers)
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-
     def test_delete_student_database_error(
-        self, client, auth_headers, mock_db_connection
+        self, client, auth_headers, mock_db_connection, mock_cursor
     ):
         """Test database error returns 500 and rolls back."""
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.execute.side_effect = Exception("Deadlock detected")
 
         response = client.delete("/students/12345", headers=auth_headers)
@@ -315,43 +645,91 @@ class TestStudentDeletion:
 
 @pytest.mark.integration
 @pytest.mark.security
+@pytest.mark.xdist_group("ratelimit")
 class TestRateLimiting:
     """Test rate limiting middleware."""
 
-    def test_rate_limit_enforcement(
-        self, client, auth_headers, mock_db_connection, sample_student_request
-    ):
-        """Test rate limiting blocks excessive requests."""
-        # Configure mock for successful operations
-        mock_cursor = mock_db_connection.cursor.return_value
-        mock_cursor.fetchone.side_effect = [None] + [[i] for i in range(100)]
-
-        # Make requests up to limit (60 per minute by default)
-        # First 60 should succeed
-        for _i in range(60):
-            response = client.post(
-                "/students", json=sample_student_request, headers=auth_headers
-            )
-            assert response.status_code in [
-                status.HTTP_200_OK,
-                status.HTTP_409_CONFLICT,
-            ]
-
-        # 61st request should be rate limited
-        response = client.post(
-            "/students", json=sample_student_request, headers=auth_headers
-        )
+    def test_rate_limit_enforcement(self, client, auth_headers):
+        """Test a client already at the limit is rejected without more requests."""
+        from app import main
+
+        main.rate_limit_store["testclient"] = deque([main.monotonic()] * 60)
+        try:
+            response = client.get("/students/12345", headers=auth_headers)
+        finally:
+            main.rate_limit_store.pop("testclient", None)
+
         assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
 
-    def test_health_check_exempt_from_rate_limiting(self, client, mock_db_connection):
-        """Test health check is not rate limited."""
-        mock_cursor = mock_db_connection.cursor.return_value
+    def test_rate_limit_counts_requests(self, client, auth_headers):
+        """Test the request that takes a client past the limit gets a 429."""
+        from app import main
+
+        main.rate_limit_store.pop("testclient", None)
+        try:
+            with patch.object(main.settings, "RATE_LIMIT_PER_MINUTE", 1):
+                first = client.get("/students/12345", headers=auth_headers)
+                second = client.get("/students/12345", headers=auth_headers)
+        finally:
+            main.rate_limit_store.pop("testclient", None)
+
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+
+    def test_rate_limit_window_expires(self, client):
+        """Test requests older than one minute no longer count toward the limit."""
+        from app import main
+
+        main.rate_limit_store.pop("10.0.0.1", None)
+
+        with patch.object(main, "monotonic", return_value=1000.0):
+            assert main.check_rate_limit("10.0.0.1", limit=2)
+            assert main.check_rate_limit("10.0.0.1", limit=2)
+            assert not main.check_rate_limit("10.0.0.1", limit=2)
+
+        with patch.object(main, "monotonic", return_value=1060.0):
+            assert main.check_rate_limit("10.0.0.1", limit=2)
+
+        assert list(main.rate_limit_store["10.0.0.1"]) == [1060.0]
+
+    def test_idle_ips_are_evicted(self, client):
+        """Test the periodic sweep drops IPs with no requests in the window."""
+        from app import main
+
+        main.rate_limit_store.pop("10.0.0.2", None)
+
+        with (
+            patch.object(main, "monotonic", return_value=1000.0),
+            patch.object(main, "_rate_limit_last_sweep", 1000.0),
+        ):
+            assert main.check_rate_limit("10.0.0.2")
+        assert "10.0.0.2" in main.rate_limit_store
+
+        main._sweep_rate_limit_store(cutoff=1340.0)
+        assert "10.0.0.2" not in main.rate_limit_store
+
+    def test_rate_limited_response(self, client, auth_headers):
+        """Test a rejected request gets the 429 JSON body without reaching routes."""
+        from app import main
+
+        with patch.object(main, "check_rate_limit", return_value=False):
+            response = client.get("/students/12345", headers=auth_headers)
+
+        assert response.status_code == status.HTTP_429_TOO_MANY_REQUESTS
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == {"detail": "Rate limit exceeded. Try again later."}
+
+    def test_health_check_exempt_from_rate_limiting(self, client, mock_cursor):
+        """Test health checks skip the limiter, even for a client over its limit."""
+        from app import main
+
         mock_cursor.fetchone.return_value = [1]
 
-        # Make 100 health check requests (well over rate limit)
-        for _ in range(100):
-            response = client.get("/health")
-            assert response.status_code == status.HTTP_200_OK
+        with patch.object(main, "check_rate_limit", return_value=False) as limiter:
+            responses = [client.get("/health") for _ in range(2)]
+
+        assert [r.status_code for r in responses] == [status.HTTP_200_OK] * 2
+        limiter.assert_not_called()
 
 
 @pytest.mark.integration
@@ -359,30 +737,30 @@ class TestRateLimiting:
 class TestAuthentication:
     """Test API key authentication."""
 
-    def test_missing_api_key(self, client, sample_student_request):
-        """Test request without X-API-Key header is rejected."""
-        response = client.post("/students", json=sample_student_request)
+    @pytest.mark.parametrize(
+        ("method", "path"),
+        [
+            ("post", "/students"),
+            ("get", "/students/12345"),
+            ("delete", "/students/12345"),
+        ],
+    )
+    @pytest.mark.parametrize(
+        ("headers", "detail"),
+        [(None, "api key required"), ({"X-API-Key": "invalid-key"}, "invalid")],
+        ids=["missing-key", "invalid-key"],
+    )
+    def test_endpoint_requires_auth(self, client, method, path, headers, detail):
+        """Test student endpoints reject missing or invalid API keys."""
+        response = client.request(method, path, headers=headers)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        data = response.json()
-        assert "api key required" in data["detail"].lower()
-
-    def test_invalid_api_key(self, client, sample_student_request):
-        """Test request with wrong API key is rejected."""
-        headers = {"X-API-Key": "wrong-key"}
-        response = client.post(
-            "/students", json=sample_student_request, headers=headers
-        )
-
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        data = response.json()
-        assert "invalid" in data["detail"].lower()
+        assert detail in response.json()["detail"].lower()
 
     def test_valid_api_key(
-        self, client, auth_headers, mock_db_connection, sample_student_request
+        self, client, auth_headers, mock_cursor, sample_student_request
     ):
         """Test request with correct API key is accepted."""
-        mock_cursor = mock_db_connection.cursor.return_value
         mock_cursor.fetchone.side_effect = [None, [999]]
 
         response = client.post(
@@ -390,3 +768,29 @@ class TestAuthentication:
         )
 
         assert response.status_code == status.HTTP_200_OK
+
+    def test_cors_preflight_skips_auth(self, client):
+        """Test CORS preflight requests are answered without an API key."""
+        response = client.options(
+            "/students/12345",
+            headers={
+                "Origin": "http://localhost:8000",
+                "Access-Control-Request-Method": "GET",
+            },
+        )
+
+        assert response.status_code == status.HTTP_200_OK
+        assert (
+            response.headers["access-control-allow-origin"] == "http://localhost:8000"
+        )
+
+    def test_unauthorized_response_has_cors_headers(self, client):
+        """Test 401 responses carry CORS headers for allowed origins."""
+        response = client.get(
+            "/students/12345", headers={"Origin": "http://localhost:8000"}
+        )
+
+        assert response.status_code == status.HTTP_401_UNAUTHORIZED
+        assert (
+            response.headers["access-control-allow-origin"] == "http://localhost:8000"
+        )
@@ -9,7 +9,11 @@ These tests verify the audit logging functionality, including:
 
 from __future__ import annotations
 
+import hashlib
 import json
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from unittest.mock import MagicMock, patch
 
@@ -19,8 +23,29 @@ from app.audit import (
     AuditEventType,
     AuditLogger,
     AuditOutcome,
+    _endpoint_metadata,
 )
 
+TEST_API_KEY = "test-api-key-12345"
+# Expected fingerprint, computed once for the whole module
+TEST_API_KEY_FINGERPRINT = hashlib.blake2b(
+    TEST_API_KEY.encode("utf-8"), digest_size=8
+).hexdigest()
+
+
+def _logged_event(mock_logger: MagicMock) -> dict:
+    """Render the last logger.info() call the way logging would and parse it."""
+    msg, *args = mock_logger.info.call_args[0]
+    return json.loads(msg % tuple(args) if args else msg)
+
+
+@pytest.fixture
+def audit_logger() -> tuple[AuditLogger, MagicMock]:
+    """AuditLogger writing to a fresh mock logger."""
+    logger = AuditLogger()
+    logger.logger = MagicMock()
+    return logger, logger.logger
+
 
 @pytest.mark.unit
 class TestAuditEvent:
@@ -76,6 +101,79 @@ class TestAuditEvent:
         assert data["outcome"]["duration_ms"] == 123.45
         assert data["metadata"]["legacy_student_id"] == 999
 
+    def test_audit_event_to_json_matches_json_dumps(self):
+        """Test the specialized encoder emits exactly what json.dumps would."""
+        event = AuditEvent(
+            event_id='test-"quoted"',
+            event_type=AuditEventType.RATE_LIMIT_EXCEEDED,
+            timestamp=datetime(2024, 1, 30, 12, 0, 0),
+            user_agent="Мозилла/5.0",
+            outcome=AuditOutcome.FAILURE,
+            outcome_reason="rate_limit_exceeded",
+            duration_ms=0.1,
+            metadata={"endpoint": "/students"},
+        )
+
+        expected = json.dumps(
+            {
+                "event_id": event.event_id,
+                "event_type": "rate_limit.exceeded",
+                "timestamp": "2024-01-30T12:00:00",
+                "actor": {
+                    "api_key_fingerprint": None,
+                    "client_ip": None,
+                    "user_agent": "Мозилла/5.0",
+                },
+                "operation": {"entity_type": None, "entity_id": None, "action": None},
+                "outcome": {
+                    "status": "failure",
+                    "reason": "rate_limit_exceeded",
+                    "duration_ms": 0.1,
+                },
+                "metadata": {"endpoint": "/students"},
+            }
+        )
+        assert event.to_json() == expected
+
+    def test_audit_event_accepts_raw_string_values(self):
+        """Test raw enum values serialize the same as enum members."""
+        common = {"event_id": "test-004", "timestamp": datetime(2024, 1, 30)}
+        from_enum = AuditEvent(
+            event_type=AuditEventType.STUDENT_READ,
+            outcome=AuditOutcome.SUCCESS,
+            **common,
+        )
+        from_str = AuditEvent(event_type="student.read", outcome="success", **common)
+
+        assert from_str.to_json() == from_enum.to_json()
+
+    @pytest.mark.parametrize(
+        "overrides", [{"event_type": "student.archived"}, {"outcome": "unknown"}]
+    )
+    def test_audit_event_to_json_rejects_unknown_raw_values(self, overrides):
+        """Test raw strings outside the enums raise KeyError."""
+        fields = {
+            "event_id": "test-006",
+            "event_type": "student.read",
+            "outcome": "success",
+        }
+        event = AuditEvent(**fields | overrides)
+
+        with pytest.raises(KeyError):
+            event.to_json()
+
+    def test_audit_event_to_json_rejects_non_json_metadata(self):
+        """Test non-JSON metadata values raise instead of being coerced."""
+        event = AuditEvent(
+            event_id="test-003",
+            event_type=AuditEventType.STUDENT_CREATED,
+            outcome=AuditOutcome.SUCCESS,
+            metadata={"when": datetime(2024, 1, 30)},
+        )
+
+        with pytest.raises(TypeError):
+            event.to_json()
+
     def test_audit_event_with_failure(self):
         """Test audit event with failure outcome."""
         event = AuditEvent(
@@ -107,31 +205,41 @@ class TestAuditLogger:
         assert len(id1.split("-")) == 3
         assert len(id2.split("-")) == 3
 
+    def test_generate_event_id_concurrent_unique(self):
+        """Test event IDs stay unique when generated from many threads."""
+        logger = AuditLogger()
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            ids = list(pool.map(lambda _: logger._generate_event_id(), range(2000)))
+
+        assert len(set(ids)) == len(ids)
+
     def test_fingerprint_api_key(self):
         """Test API key fingerprinting."""
         logger = AuditLogger()
 
         # Same key should produce same fingerprint
-        key = "test-api-key-12345"
+        key = TEST_API_KEY
         fp1 = logger._fingerprint_api_key(key)
         fp2 = logger._fingerprint_api_key(key)
 
         assert fp1 == fp2
-        assert len(fp1) == 16  # First 16 chars of SHA256
+        assert len(fp1) == 16  # 8-byte BLAKE2b digest as hex
 
         # Different keys should produce different fingerprints
         different_key = "different-api-key"
         fp3 = logger._fingerprint_api_key(different_key)
         assert fp3 != fp1
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_student_created_success(self, mock_get_logger):
-        """Test logging successful student creation."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
+    def test_fingerprint_api_key_matches_blake2b(self):
+        """Test fingerprints are the 8-byte BLAKE2b digest of the key."""
         logger = AuditLogger()
-        logger.logger = mock_logger
+
+        assert logger._fingerprint_api_key(TEST_API_KEY) == TEST_API_KEY_FINGERPRINT
+
+    def test_log_student_created_success(self, audit_logger):
+        """Test logging successful student creation."""
+        logger, mock_logger = audit_logger
 
         logger.log_student_created(
             student_id=12345,
@@ -144,23 +252,15 @@ class TestAuditLogger:
 
         # Verify logger.info was called
         assert mock_logger.info.called
-        call_args = mock_logger.info.call_args[0][0]
-
-        # Verify JSON structure
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["event_type"] == "student.created"
         assert data["operation"]["entity_id"] == 12345
         assert data["outcome"]["status"] == "success"
         assert data["metadata"]["legacy_student_id"] == 999
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_student_created_failure(self, mock_get_logger):
+    def test_log_student_created_failure(self, audit_logger):
         """Test logging failed student creation."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        logger = AuditLogger()
-        logger.logger = mock_logger
+        logger, mock_logger = audit_logger
 
         logger.log_student_created(
             student_id=12345,
@@ -172,19 +272,13 @@ class TestAuditLogger:
             reason="duplicate_student_id",
         )
 
-        call_args = mock_logger.info.call_args[0][0]
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["outcome"]["status"] == "failure"
         assert data["outcome"]["reason"] == "duplicate_student_id"
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_student_read(self, mock_get_logger):
+    def test_log_student_read(self, audit_logger):
         """Test logging student read operation."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        logger = AuditLogger()
-        logger.logger = mock_logger
+        logger, mock_logger = audit_logger
 
         logger.log_student_read(
             student_id=12345,
@@ -194,20 +288,14 @@ class TestAuditLogger:
             found=True,
         )
 
-        call_args = mock_logger.info.call_args[0][0]
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["event_type"] == "student.read"
         assert data["operation"]["entity_id"] == 12345
         assert data["outcome"]["status"] == "success"
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_student_read_not_found(self, mock_get_logger):
+    def test_log_student_read_not_found(self, audit_logger):
         """Test logging student read when not found."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        logger = AuditLogger()
-        logger.logger = mock_logger
+        logger, mock_logger = audit_logger
 
         logger.log_student_read(
             student_id=99999,
@@ -216,19 +304,13 @@ class TestAuditLogger:
             found=False,
         )
 
-        call_args = mock_logger.info.call_args[0][0]
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["outcome"]["status"] == "failure"
         assert data["outcome"]["reason"] == "not_found"
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_student_deleted(self, mock_get_logger):
+    def test_log_student_deleted(self, audit_logger):
         """Test logging student deletion."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        logger = AuditLogger()
-        logger.logger = mock_logger
+        logger, mock_logger = audit_logger
 
         logger.log_student_deleted(
             student_id=12345,
@@ -238,20 +320,14 @@ class TestAuditLogger:
             success=True,
         )
 
-        call_args = mock_logger.info.call_args[0][0]
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["event_type"] == "student.deleted"
         assert data["operation"]["action"] == "soft_delete"
         assert data["outcome"]["status"] == "success"
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_auth_failure(self, mock_get_logger):
+    def test_log_auth_failure(self, audit_logger):
         """Test logging authentication failure."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        logger = AuditLogger()
-        logger.logger = mock_logger
+        logger, mock_logger = audit_logger
 
         logger.log_auth_failure(
             api_key_provided="wrong-key",
@@ -259,20 +335,14 @@ class TestAuditLogger:
             reason="invalid_api_key",
         )
 
-        call_args = mock_logger.info.call_args[0][0]
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["event_type"] == "auth.failure"
         assert data["outcome"]["status"] == "failure"
         assert data["outcome"]["reason"] == "invalid_api_key"
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_auth_failure_missing_key(self, mock_get_logger):
+    def test_log_auth_failure_missing_key(self, audit_logger):
         """Test logging auth failure when API key is missing."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        logger = AuditLogger()
-        logger.logger = mock_logger
+        logger, mock_logger = audit_logger
 
         logger.log_auth_failure(
             api_key_provided=None,
@@ -280,19 +350,13 @@ class TestAuditLogger:
             reason="missing_api_key",
         )
 
-        call_args = mock_logger.info.call_args[0][0]
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["actor"]["api_key_fingerprint"] is None
         assert data["outcome"]["reason"] == "missing_api_key"
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_rate_limit_exceeded(self, mock_get_logger):
+    def test_log_rate_limit_exceeded(self, audit_logger):
         """Test logging rate limit violation."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        logger = AuditLogger()
-        logger.logger = mock_logger
+        logger, mock_logger = audit_logger
 
         logger.log_rate_limit_exceeded(
             client_ip="192.168.1.200",
@@ -300,19 +364,13 @@ class TestAuditLogger:
             endpoint="/students",
         )
 
-        call_args = mock_logger.info.call_args[0][0]
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["event_type"] == "rate_limit.exceeded"
         assert data["metadata"]["endpoint"] == "/students"
 
-    @patch("app.audit.logging.getLogger")
-    def test_log_database_error(self, mock_get_logger):
+    def test_log_database_error(self, audit_logger):
         """Test logging database error."""
-        mock_logger = MagicMock()
-        mock_get_logger.return_value = mock_logger
-
-        logger = AuditLogger()
-        logger.logger = mock_logger
+        logger, mock_logger = audit_logger
 
         logger.log_database_error(
             operation="create_student",
@@ -323,20 +381,147 @@ class TestAuditLogger:
             client_ip="192.168.1.100",
         )
 
-        call_args = mock_logger.info.call_args[0][0]
-        data = json.loads(call_args)
+        data = _logged_event(mock_logger)
         assert data["event_type"] == "error.database"
         assert data["outcome"]["reason"] == "Connection timeout"
         assert data["operation"]["entity_type"] == "student"
 
+    def test_precomputed_fingerprint_skips_hashing(self, audit_logger):
+        """Test a fingerprint passed by the caller is used as-is."""
+        logger, mock_logger = audit_logger
+
+        with patch.object(logger, "_fingerprint_api_key") as mock_fingerprint:
+            logger.log_student_read(
+                student_id=12345,
+                api_key="test-key",
+                api_key_fingerprint="precomputed01234",
+            )
+
+        assert not mock_fingerprint.called
+        data = _logged_event(mock_logger)
+        assert data["actor"]["api_key_fingerprint"] == "precomputed01234"
+
+    def test_endpoint_metadata_shared_and_read_only(self):
+        """Test repeated endpoint metadata reuses one immutable dict."""
+        first = _endpoint_metadata("/students")
+        second = _endpoint_metadata("/students")
+
+        assert first is second
+        assert json.loads(json.dumps(first)) == {"endpoint": "/students"}
+        with pytest.raises(TypeError):
+            first["endpoint"] = "/other"
+
+    @patch("app.audit.AuditEvent")
+    def test_disabled_logger_skips_event_construction(
+        self, mock_event_cls, audit_logger
+    ):
+        """Test no event is built or logged when INFO is disabled."""
+        logger, mock_logger = audit_logger
+        mock_logger.isEnabledFor.return_value = False
+
+        logger.log_student_read(student_id=12345, api_key="test-key")
+
+        assert not mock_event_cls.called
+        assert not mock_logger.info.called
+
+    def test_start_routes_events_through_background_listener(self):
+        """Test start() queues records and close() flushes and restores."""
+        records: list[logging.LogRecord] = []
+
+        class ListHandler(logging.Handler):
+            def emit(self, record):
+                records.append(record)
+
+        handler = ListHandler()
+        logger = AuditLogger()
+        logger.logger = logging.getLogger("audit.test_queue")
+        logger.logger.setLevel(logging.INFO)
+        logger.logger.addHandler(handler)
+
+        try:
+            logger.start()
+            assert logger.logger.handlers != [handler]
+
+            logger.log_student_read(student_id=12345, client_ip="10.0.0.1")
+            logger.close()
+
+            assert logger.logger.handlers == [handler]
+            assert len(records) == 1
+            # Enqueued unformatted; the listener's handlers do the formatting
+            assert records[0].msg == "%s"
+            data = json.loads(records[0].getMessage())
+            assert data["event_type"] == "student.read"
+        finally:
+            logger.close()
+            logger.logger.removeHandler(handler)
+
+    @pytest.mark.parametrize(
+        "overrides",
+        [
+            {"metadata": {"when": datetime(2024, 1, 30)}},
+            {"event_type": "student.archived"},
+            {"outcome": "unknown"},
+        ],
+    )
+    def test_unencodable_event_is_still_logged(self, audit_logger, overrides):
+        """Test events the strict encoder rejects fall back instead of dropping."""
+        logger, mock_logger = audit_logger
+        fields = {
+            "event_id": "test-005",
+            "event_type": AuditEventType.STUDENT_CREATED,
+            "outcome": AuditOutcome.SUCCESS,
+            "entity_id": 12345,
+        }
+        event = AuditEvent(**fields | overrides)
+
+        logger.log_event(event)
+
+        logged = _logged_event(mock_logger)
+        assert logged["event_id"] == "test-005"
+        assert logged["operation"]["entity_id"] == 12345
+        assert "serialization_error" in logged
+
+    def test_started_logger_serializes_on_listener_thread(self):
+        """Test events are serialized by the listener, once per record."""
+        serialized_on: list[int] = []
+        to_json = AuditEvent.to_json
+
+        def tracking_to_json(event):
+            serialized_on.append(threading.get_ident())
+            return to_json(event)
+
+        class FormattingHandler(logging.Handler):
+            def emit(self, record):
+                self.format(record)
+
+        handlers = [FormattingHandler(), FormattingHandler()]
+        logger = AuditLogger()
+        logger.logger = logging.getLogger("audit.test_lazy")
+        logger.logger.setLevel(logging.INFO)
+        for handler in handlers:
+            logger.logger.addHandler(handler)
+
+        try:
+            with patch.object(AuditEvent, "to_json", tracking_to_json):
+                logger.start()
+                logger.log_student_read(student_id=12345)
+                logger.close()
+        finally:
+            logger.close()
+            for handler in handlers:
+                logger.logger.removeHandler(handler)
+
+        assert len(serialized_on) == 1
+        assert serialized_on[0] != threading.get_ident()
+
 
 @pytest.mark.unit
 class TestAuditEventTypes:
     """Test all audit event types are covered."""
 
-    def test_all_event_types_defined(self):
-        """Test that all expected event types are defined."""
-        expected_events = [
+    @pytest.mark.parametrize(
+        "event_name",
+        [
             "STUDENT_CREATED",
             "STUDENT_READ",
             "STUDENT_UPDATED",
@@ -351,12 +536,11 @@ class TestAuditEventTypes:
             "DATABASE_ERROR",
             "VALIDATION_ERROR",
             "INTERNAL_ERROR",
-        ]
-
-        for event_name in expected_events:
-            assert hasattr(AuditEventType, event_name), (
-                f"Missing event type: {event_name}"
-            )
+        ],
+    )
+    def test_all_event_types_defined(self, event_name):
+        """Test that each expected event type is defined."""
+        assert hasattr(AuditEventType, event_name), f"Missing event type: {event_name}"
 
     def test_outcome_types(self):
         """Test that all outcome types are defined."""
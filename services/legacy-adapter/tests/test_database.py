@@ -0,0 +1,148 @@
+"""Unit tests for legacy database connection pooling.
+
+These tests verify that connections are reused across requests instead of
+re-running the MSSQL login handshake, and that failed or stale connections
+are never handed out again.
+"""
+
+from __future__ import annotations
+
+import queue
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from app import database
+
+
+@pytest.fixture(autouse=True)
+def empty_pool():
+    """Start and finish every test with an empty, default-sized pool."""
+    database.close_connection_pool()
+    yield
+    database.close_connection_pool()
+    database._pool = queue.LifoQueue(maxsize=database.settings.DB_POOL_SIZE)
+    database._permits = threading.BoundedSemaphore(database.settings.DB_POOL_SIZE)
+
+
+@pytest.mark.unit
+class TestConnectionPool:
+    """Test pooled get_connection()."""
+
+    @patch("app.database.pymssql.connect")
+    def test_connection_reused_after_close(self, mock_connect):
+        """Test close() returns the connection to the pool for reuse."""
+        mock_connect.return_value = MagicMock()
+
+        conn = database.get_connection()
+        conn.close()
+        conn_again = database.get_connection()
+
+        assert mock_connect.call_count == 1
+        assert conn_again._conn is mock_connect.return_value
+        assert not mock_connect.return_value.close.called
+
+    @patch("app.database.pymssql.connect")
+    def test_rolled_back_connection_discarded(self, mock_connect):
+        """Test a connection that was rolled back is closed, not pooled."""
+        raw_conn = MagicMock()
+        mock_connect.return_value = raw_conn
+
+        conn = database.get_connection()
+        conn.rollback()
+        conn.close()
+
+        assert raw_conn.close.called
+        database.get_connection()
+        assert mock_connect.call_count == 2
+
+    @patch("app.database.pymssql.connect")
+    def test_stale_connection_replaced(self, mock_connect):
+        """Test idle connections that fail SELECT 1 are replaced."""
+        stale_conn = MagicMock()
+        stale_conn.cursor.return_value.execute.side_effect = Exception("gone")
+        fresh_conn = MagicMock()
+        mock_connect.side_effect = [stale_conn, fresh_conn]
+
+        database.get_connection().close()
+        with patch("app.database.POOL_RECYCLE_SECONDS", 0.0):
+            conn = database.get_connection()
+
+        assert conn._conn is fresh_conn
+        assert stale_conn.close.called
+
+    @patch("app.database.pymssql.connect")
+    def test_close_pool_closes_idle_connections(self, mock_connect):
+        """Test close_connection_pool() closes every idle connection."""
+        mock_connect.return_value = MagicMock()
+
+        database.get_connection().close()
+        database.close_connection_pool()
+
+        assert mock_connect.return_value.close.called
+
+    @patch("app.database.pymssql.connect")
+    def test_checkout_waits_then_times_out(self, mock_connect):
+        """Test get_connection() gives up once DB_POOL_SIZE connections are out."""
+        mock_connect.return_value = MagicMock()
+        database.init_connection_pool(size=1, min_size=1)
+
+        held = database.get_connection()
+        with (
+            patch.object(database.settings, "DB_POOL_TIMEOUT", 0.01),
+            pytest.raises(RuntimeError, match="Timed out"),
+        ):
+            database.get_connection()
+
+        held.close()
+        database.get_connection().close()
+        assert mock_connect.call_count == 1
+
+    @patch("app.database.pymssql.connect")
+    def test_unclosed_connection_releases_permit(self, mock_connect):
+        """Test a connection dropped without close() frees its slot."""
+        mock_connect.return_value = MagicMock()
+        database.init_connection_pool(size=1, min_size=1)
+
+        database.get_connection()  # never closed; released when collected
+        with patch.object(database.settings, "DB_POOL_TIMEOUT", 0.01):
+            database.get_connection().close()
+
+        assert mock_connect.call_count == 2
+
+    @patch("app.database.pymssql.connect")
+    def test_init_opens_min_connections(self, mock_connect):
+        """Test init_connection_pool() pre-opens min_size connections."""
+        mock_connect.side_effect = [MagicMock(), MagicMock(), MagicMock()]
+
+        database.init_connection_pool(size=3, min_size=2)
+
+        assert mock_connect.call_count == 2
+        assert database._pool.qsize() == 2
+
+    @patch("app.database.pymssql.connect")
+    def test_db_cursor_returns_connection_to_pool(self, mock_connect):
+        """Test db_cursor() closes the cursor and pools the connection on success."""
+        raw_conn = MagicMock()
+        mock_connect.return_value = raw_conn
+
+        with database.db_cursor(as_dict=True) as (_conn, cursor):
+            cursor.execute("SELECT 1")
+
+        raw_conn.cursor.assert_called_once_with(as_dict=True)
+        assert cursor.close.called
+        assert database._pool.qsize() == 1
+
+    @patch("app.database.pymssql.connect")
+    def test_db_cursor_rolls_back_on_error(self, mock_connect):
+        """Test an exception inside db_cursor() rolls back and discards."""
+        raw_conn = MagicMock()
+        mock_connect.return_value = raw_conn
+
+        with pytest.raises(ValueError), database.db_cursor() as (_conn, _cursor):
+            raise ValueError("boom")
+
+        assert raw_conn.rollback.called
+        assert raw_conn.close.called
+        assert database._pool.qsize() == 0
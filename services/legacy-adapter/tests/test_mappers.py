@@ -13,8 +13,95 @@ from __future__ import annotations
 from datetime import date
 
 import pytest
-from app.mappers import django_student_to_legacy, legacy_student_to_django
+from app.mappers import (
+    STATUS_MAP,
+    django_student_to_legacy,
+    legacy_student_to_django,
+)
 from app.models import StudentCreateRequest
+from pydantic import ValidationError
+
+STATUS_CASES = [
+    ("ACTIVE", "Active"),
+    ("INACTIVE", "Inactive"),
+    ("GRADUATED", "Graduated"),
+    ("DROPPED", "Dropped"),
+    ("SUSPENDED", "Suspended"),
+    ("TRANSFERRED", "Transferred"),
+    ("FROZEN", "Frozen"),
+    ("UNKNOWN", "Unknown"),
+    ("INVALID_STATUS", "Unknown"),  # Unknown status defaults to "Unknown"
+]
+
+STATUS_REVERSE_CASES = [
+    ("Active", "ACTIVE"),
+    ("Inactive", "INACTIVE"),
+    ("Graduated", "GRADUATED"),
+    ("Dropped", "DROPPED"),
+    ("Suspended", "SUSPENDED"),
+    ("Transferred", "TRANSFERRED"),
+    ("Frozen", "FROZEN"),
+    ("Unknown", "UNKNOWN"),
+    (None, "UNKNOWN"),  # None defaults to UNKNOWN
+]
+
+STUDY_TIME_CASES = [
+    ("morning", "Morning"),
+    ("afternoon", "Afternoon"),
+    ("evening", "Evening"),
+    (None, None),  # Null handling
+]
+
+# (legacy Gender, expected gender, expected is_monk)
+GENDER_EDGE_CASES = [
+    (" f ", "F", False),
+    ("F ", "F", False),
+    (" Monk", "M", True),
+    ("?", "M", False),  # Unknown values default to M
+    (None, "M", False),
+]
+
+# Dates shared by many tests
+_DOB = date(2000, 1, 1)
+_ENROLLMENT_DATE = date(2024, 1, 10)
+
+# Minimal legacy row; tests override the keys they exercise with ``|``,
+# which returns a new dict and leaves this one untouched.
+_BASE_LEGACY_MINIMAL = {
+    "StudentID": 111,
+    "StudentCode": 12345,
+    "FirstName": "Test",
+    "LastName": "Student",
+    "DateOfBirth": _DOB,
+    "Gender": "M",
+    "Status": "Active",
+    "IsMonk": False,
+}
+
+# Required fields for tests that validate a real StudentCreateRequest
+_EMAIL_REQUEST_FIELDS = {
+    "student_id": 44446,
+    "first_name": "Mail",
+    "last_name": "Student",
+    "date_of_birth": _DOB,
+    "gender": "M",
+}
+
+
+def _make_request(**overrides) -> StudentCreateRequest:
+    """Build a known-valid request without re-running validation.
+
+    For table-driven sweeps; unset optional fields take their model defaults.
+    Validation itself is covered by the tests that call StudentCreateRequest().
+    """
+    fields = {
+        "student_id": 12345,
+        "first_name": "Test",
+        "last_name": "Student",
+        "date_of_birth": _DOB,
+        "gender": "M",
+    }
+    return StudentCreateRequest.model_construct(**(fields | overrides))
 
 
 @pytest.mark.unit
@@ -38,7 +125,7 @@ class TestDjangoToLegacyMapping:
             preferred_study_time="morning",
             is_transfer_student=False,
             status="ACTIVE",
-            enrollment_date=date(2024, 1, 10),
+            enrollment_date=_ENROLLMENT_DATE,
         )
 
         result = django_student_to_legacy(request)
@@ -54,7 +141,7 @@ class TestDjangoToLegacyMapping:
         assert result["Gender"] == "M"
         assert result["Email"] == "sopheak.chan@example.com"
         assert result["PhoneNumber"] == "+85512345678"
-        assert result["EnrollmentDate"] == date(2024, 1, 10)
+        assert result["EnrollmentDate"] == _ENROLLMENT_DATE
         assert result["Status"] == "Active"  # ACTIVE → Active (title case)
         assert result["IsMonk"] is False
         assert result["PreferredStudyTime"] == "Morning"  # morning → Morning
@@ -122,54 +209,19 @@ class TestDjangoToLegacyMapping:
 
         assert result["Gender"] == "M"  # Default for unsupported gender
 
-    def test_status_mapping_all_values(self):
+    @pytest.mark.parametrize(("django_status", "expected_legacy"), STATUS_CASES)
+    def test_status_mapping_all_values(self, django_status, expected_legacy):
         """Test all status code mappings."""
-        status_tests = [
-            ("ACTIVE", "Active"),
-            ("INACTIVE", "Inactive"),
-            ("GRADUATED", "Graduated"),
-            ("DROPPED", "Dropped"),
-            ("SUSPENDED", "Suspended"),
-            ("TRANSFERRED", "Transferred"),
-            ("FROZEN", "Frozen"),
-            ("UNKNOWN", "Unknown"),
-            ("INVALID_STATUS", "Unknown"),  # Unknown status defaults to "Unknown"
-        ]
-
-        for django_status, expected_legacy in status_tests:
-            request = StudentCreateRequest(
-                student_id=12345,
-                first_name="Test",
-                last_name="Student",
-                date_of_birth=date(2000, 1, 1),
-                gender="M",
-                status=django_status,
-            )
-            result = django_student_to_legacy(request)
-            assert result["Status"] == expected_legacy, (
-                f"Failed for status: {django_status}"
-            )
-
-    def test_study_time_mapping(self):
+        result = django_student_to_legacy(_make_request(status=django_status))
+        assert result["Status"] == expected_legacy
+
+    @pytest.mark.parametrize(("django_time", "expected_legacy"), STUDY_TIME_CASES)
+    def test_study_time_mapping(self, django_time, expected_legacy):
         """Test study time preference mapping."""
-        study_time_tests = [
-            ("morning", "Morning"),
-            ("afternoon", "Afternoon"),
-            ("evening", "Evening"),
-            (None, None),  # Null handling
-        ]
-
-        for django_time, expected_legacy in study_time_tests:
-            request = StudentCreateRequest(
-                student_id=12345,
-                first_name="Test",
-                last_name="Student",
-                date_of_birth=date(2000, 1, 1),
-                gender="M",
-                preferred_study_time=django_time,
-            )
-            result = django_student_to_legacy(request)
-            assert result["PreferredStudyTime"] == expected_legacy
+        result = django_student_to_legacy(
+            _make_request(preferred_study_time=django_time)
+        )
+        assert result["PreferredStudyTime"] == expected_legacy
 
     def test_optional_fields_none(self):
         """Test mapping with all optional fields set to None."""
@@ -177,7 +229,7 @@ class TestDjangoToLegacyMapping:
             student_id=44444,
             first_name="Minimal",
             last_name="Student",
-            date_of_birth=date(2000, 1, 1),
+            date_of_birth=_DOB,
             gender="M",
             # All optional fields omitted (None)
             middle_name=None,
@@ -199,6 +251,40 @@ class TestDjangoToLegacyMapping:
         assert result["PreferredStudyTime"] is None
         assert result["EnrollmentDate"] == date.today()  # Auto-filled
 
+    @pytest.mark.parametrize(
+        "email", ["first.last+tag@example.edu.kh", "សុភា@example.com"]
+    )
+    def test_valid_email_accepted(self, email):
+        """Test valid addresses, including internationalized ones, are accepted."""
+        request = StudentCreateRequest(**_EMAIL_REQUEST_FIELDS, email=email)
+        assert request.email == email
+
+    @pytest.mark.parametrize(
+        "bad_email", ["not-an-email", "a@b", "@example.com", "a b@example.com"]
+    )
+    def test_invalid_email_rejected(self, bad_email):
+        """Test malformed addresses are rejected."""
+        with pytest.raises(ValidationError):
+            StudentCreateRequest(**_EMAIL_REQUEST_FIELDS, email=bad_email)
+
+    def test_enrollment_date_fallback_uses_given_today(self):
+        """Test an explicit today only fills a missing enrollment date."""
+        request = StudentCreateRequest(
+            student_id=44445,
+            first_name="Minimal",
+            last_name="Student",
+            date_of_birth=_DOB,
+            gender="F",
+        )
+        enrolled = request.model_copy(update={"enrollment_date": _ENROLLMENT_DATE})
+
+        today = date(2025, 6, 1)
+
+        assert django_student_to_legacy(request, today=today)["EnrollmentDate"] == today
+        assert django_student_to_legacy(enrolled, today=today)["EnrollmentDate"] == (
+            _ENROLLMENT_DATE
+        )
+
 
 @pytest.mark.unit
 class TestLegacyToDjangoMapping:
@@ -225,54 +311,39 @@ class TestLegacyToDjangoMapping:
         assert result["gender"] == "M"  # Monk → M (default gender)
         assert result["is_monk"] is True  # Extracted from Gender='Monk'
 
-    def test_monk_casing_variations(self):
+    @pytest.mark.parametrize("monk_value", ["Monk", "monk", "MONK", "MoNk"])
+    def test_monk_casing_variations(self, monk_value):
         """Test that Gender='Monk' works regardless of casing."""
-        casing_tests = ["Monk", "monk", "MONK", "MoNk"]
-
-        for monk_value in casing_tests:
-            legacy_record = {
-                "StudentID": 777,
-                "StudentCode": 55555,
-                "FirstName": "Test",
-                "LastName": "Monk",
-                "DateOfBirth": date(2000, 1, 1),
-                "Gender": monk_value,
-                "Status": "Active",
-                "IsMonk": True,
-            }
-            result = legacy_student_to_django(legacy_record)
-            assert result["is_monk"] is True, f"Failed for Gender='{monk_value}'"
-            assert result["gender"] == "M"
-
-    def test_status_reverse_mapping(self):
+        legacy_record = _BASE_LEGACY_MINIMAL | {"Gender": monk_value, "IsMonk": True}
+        result = legacy_student_to_django(legacy_record)
+        assert result["is_monk"] is True
+        assert result["gender"] == "M"
+
+    @pytest.mark.parametrize(
+        ("legacy_gender", "expected_gender", "expected_monk"), GENDER_EDGE_CASES
+    )
+    def test_gender_whitespace_and_unknown_values(
+        self, legacy_gender, expected_gender, expected_monk
+    ):
+        """Test padded legacy genders normalize and unknown values default to M."""
+        result = legacy_student_to_django({"Gender": legacy_gender})
+        assert result["gender"] == expected_gender
+        assert result["is_monk"] is expected_monk
+
+    @pytest.mark.parametrize(("legacy_status", "expected_django"), STATUS_REVERSE_CASES)
+    def test_status_reverse_mapping(self, legacy_status, expected_django):
         """Test all status reverse mappings."""
-        status_tests = [
-            ("Active", "ACTIVE"),
-            ("Inactive", "INACTIVE"),
-            ("Graduated", "GRADUATED"),
-            ("Dropped", "DROPPED"),
-            ("Suspended", "SUSPENDED"),
-            ("Transferred", "TRANSFERRED"),
-            ("Frozen", "FROZEN"),
-            ("Unknown", "UNKNOWN"),
-            (None, "UNKNOWN"),  # None defaults to UNKNOWN
-        ]
-
-        for legacy_status, expected_django in status_tests:
-            legacy_record = {
-                "StudentID": 111,
-                "StudentCode": 12345,
-                "FirstName": "Test",
-                "LastName": "Student",
-                "DateOfBirth": date(2000, 1, 1),
-                "Gender": "M",
-                "Status": legacy_status,
-                "IsMonk": False,
-            }
-            result = legacy_student_to_django(legacy_record)
-            assert result["status"] == expected_django, (
-                f"Failed for status: {legacy_status}"
-            )
+        legacy_record = _BASE_LEGACY_MINIMAL | {"Status": legacy_status}
+        result = legacy_student_to_django(legacy_record)
+        assert result["status"] == expected_django
+
+    @pytest.mark.parametrize("django_status", list(STATUS_MAP))
+    def test_status_round_trip(self, django_status):
+        """Test every Django status survives a round trip through legacy."""
+        legacy = django_student_to_legacy(_make_request(status=django_status))
+        legacy_record = _BASE_LEGACY_MINIMAL | {"Status": legacy["Status"]}
+        result = legacy_student_to_django(legacy_record)
+        assert result["status"] == django_status
 
     def test_missing_optional_fields(self):
         """Test handling of missing optional fields in legacy record."""
@@ -281,7 +352,7 @@ class TestLegacyToDjangoMapping:
             "StudentCode": 66666,
             "FirstName": "Minimal",
             "LastName": "Record",
-            "DateOfBirth": date(2000, 1, 1),
+            "DateOfBirth": _DOB,
             "Gender": "F",
             "Status": "Active",
             # Missing: MiddleName, English names, email, phone, etc.
@@ -297,32 +368,50 @@ class TestLegacyToDjangoMapping:
         assert result["is_monk"] is False  # Default when IsMonk missing
 
 
+@pytest.fixture(scope="module")
+def standard_roundtrip() -> tuple[StudentCreateRequest, dict]:
+    """Standard student mapped Django → Legacy → Django once per module."""
+    original_request = StudentCreateRequest(
+        student_id=77777,
+        first_name="Roundtrip",
+        last_name="Test",
+        date_of_birth=date(2000, 6, 15),
+        gender="F",
+        email="roundtrip@example.com",
+        status="ACTIVE",
+        is_monk=False,
+        preferred_study_time="afternoon",
+    )
+
+    # Simulate legacy database record (add StudentID)
+    legacy_data = django_student_to_legacy(original_request) | {"StudentID": 999}
+    return original_request, legacy_student_to_django(legacy_data)
+
+
+@pytest.fixture(scope="module")
+def monk_roundtrip() -> tuple[dict, dict]:
+    """Monk student's legacy record and its mapping back to Django."""
+    original_request = StudentCreateRequest(
+        student_id=88888,
+        first_name="Monk",
+        last_name="Roundtrip",
+        date_of_birth=date(1995, 3, 20),
+        gender="M",
+        is_monk=True,
+        status="ACTIVE",
+    )
+
+    legacy_data = django_student_to_legacy(original_request) | {"StudentID": 888}
+    return legacy_data, legacy_student_to_django(legacy_data)
+
+
 @pytest.mark.unit
 class TestRoundTripMapping:
     """Test bidirectional mapping consistency."""
 
-    def test_roundtrip_standard_student(self):
+    def test_roundtrip_standard_student(self, standard_roundtrip):
         """Test Django → Legacy → Django produces consistent data."""
-        original_request = StudentCreateRequest(
-            student_id=77777,
-            first_name="Roundtrip",
-            last_name="Test",
-            date_of_birth=date(2000, 6, 15),
-            gender="F",
-            email="roundtrip@example.com",
-            status="ACTIVE",
-            is_monk=False,
-            preferred_study_time="afternoon",
-        )
-
-        # Django → Legacy
-        legacy_data = django_student_to_legacy(original_request)
-
-        # Simulate legacy database record (add StudentID)
-        legacy_data["StudentID"] = 999
-
-        # Legacy → Django
-        django_data = legacy_student_to_django(legacy_data)
+        original_request, django_data = standard_roundtrip
 
         # Verify key fields match
         assert django_data["student_id"] == original_request.student_id
@@ -335,28 +424,12 @@ class TestRoundTripMapping:
             django_data["preferred_study_time"] == original_request.preferred_study_time
         )
 
-    def test_roundtrip_monk_student(self):
+    def test_roundtrip_monk_student(self, monk_roundtrip):
         """Test monk student roundtrip mapping."""
-        original_request = StudentCreateRequest(
-            student_id=88888,
-            first_name="Monk",
-            last_name="Roundtrip",
-            date_of_birth=date(1995, 3, 20),
-            gender="M",
-            is_monk=True,
-            status="ACTIVE",
-        )
+        legacy_data, django_data = monk_roundtrip
 
-        # Django → Legacy
-        legacy_data = django_student_to_legacy(original_request)
         assert legacy_data["Gender"] == "Monk"  # Monk override
 
-        # Simulate legacy database record
-        legacy_data["StudentID"] = 888
-
-        # Legacy → Django
-        django_data = legacy_student_to_django(legacy_data)
-
         # Verify monk flag preserved
         assert django_data["is_monk"] is True
         assert django_data["gender"] == "M"  # Extracted from Monk
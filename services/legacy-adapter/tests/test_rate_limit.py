@@ -0,0 +1,80 @@
+"""Tests for the Redis-backed rate limiter.
+
+A mocked async Redis client stands in for the server, so these tests cover
+result handling and the fallback circuit breaker rather than the Lua script.
+"""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.rate_limit import RATE_LIMIT_LUA, RedisRateLimiter
+
+
+class NoScriptError(Exception):
+    """Stand-in for ``redis.exceptions.NoScriptError``."""
+
+
+@pytest.fixture
+def limiter() -> RedisRateLimiter:
+    """Limiter with a mocked, already-connected Redis client."""
+    limiter = RedisRateLimiter("redis://localhost:6379/0")
+    limiter._client = AsyncMock()
+    limiter._sha = "abc123"
+    limiter._no_script_errors = (NoScriptError,)
+    return limiter
+
+
+class TestRedisRateLimiter:
+    """Test RedisRateLimiter."""
+
+    async def test_allowed_request(self, limiter):
+        """Test script result 1 allows the request."""
+        limiter._client.evalsha.return_value = 1
+
+        assert await limiter.allow("10.0.0.1", 60) is True
+
+        args = limiter._client.evalsha.call_args.args
+        assert args[:3] == ("abc123", 1, "rl:10.0.0.1")
+        assert args[4:6] == (60_000, 60)
+
+    async def test_limited_request(self, limiter):
+        """Test script result 0 rejects the request."""
+        limiter._client.evalsha.return_value = 0
+
+        assert await limiter.allow("10.0.0.1", 60) is False
+
+    async def test_missing_script_is_reloaded(self, limiter):
+        """Test NOSCRIPT reloads the script and retries once."""
+        limiter._client.evalsha.side_effect = [NoScriptError("NOSCRIPT"), 1]
+        limiter._client.script_load.return_value = "def456"
+
+        assert await limiter.allow("10.0.0.1", 60) is True
+
+        limiter._client.script_load.assert_awaited_once_with(RATE_LIMIT_LUA)
+        assert limiter._client.evalsha.call_args.args[0] == "def456"
+        assert limiter._sha == "def456"
+
+    async def test_missing_script_reload_failure_falls_back(self, limiter):
+        """Test a failed script reload opens the circuit like any Redis error."""
+        limiter._client.evalsha.side_effect = NoScriptError("NOSCRIPT")
+        limiter._client.script_load.side_effect = ConnectionError("refused")
+
+        assert await limiter.allow("10.0.0.1", 60) is None
+        assert limiter._retry_at > 0
+
+    async def test_redis_error_falls_back(self, limiter):
+        """Test a Redis error returns None and skips Redis while the circuit is open."""
+        limiter._client.evalsha.side_effect = ConnectionError("refused")
+
+        assert await limiter.allow("10.0.0.1", 60) is None
+        assert await limiter.allow("10.0.0.1", 60) is None
+        assert limiter._client.evalsha.call_count == 1
+
+    async def test_not_connected(self):
+        """Test an unconnected limiter defers to the in-memory limiter."""
+        limiter = RedisRateLimiter("redis://localhost:6379/0")
+
+        assert await limiter.allow("10.0.0.1", 60) is None
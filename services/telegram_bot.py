@@ -1,9 +1,14 @@
-import requests
+import urllib3
 import os
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Shared pool so consecutive messages reuse the keep-alive TLS connection
+# to api.telegram.org. urllib3 directly skips the requests session layer;
+# retries are off to match the previous requests behaviour.
+_pool = urllib3.PoolManager(num_pools=2, maxsize=16, timeout=10.0, retries=False)
+
 
 def send_telegram_message(chat_id: str, message: str):
     """
@@ -23,8 +28,11 @@ def send_telegram_message(chat_id: str, message: str):
     payload = {"chat_id": chat_id, "text": message}
 
     try:
-        response = requests.post(url, json=payload, timeout=10)
-        response.raise_for_status()
+        response = _pool.request("POST", url, json=payload)
+        if response.status >= 400:
+            # Telegram's JSON body carries the error "description"
+            body = response.data.decode("utf-8", "replace")
+            raise RuntimeError(f"HTTP {response.status}: {body}")
         logger.info(f"Telegram message sent to {chat_id}")
         return True
     except Exception as e:
@@ -1,6 +1,7 @@
 import os
 import sys
 import logging
+import traceback
 
 # Add project root to path
 sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
@@ -55,9 +56,8 @@ def diagnose():
         print("✅ Connection closed.")
     except Exception as e:
         print(f"❌ Connection failed: {e}")
-        # Print detailed pymssql error if available
-        if hasattr(e, "args"):
-            print(f"Error Args: {e.args}")
+        # Print the exception type with the detailed pymssql error args
+        print("".join(traceback.format_exception_only(type(e), e)), end="")
 
 
 if __name__ == "__main__":
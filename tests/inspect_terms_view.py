@@ -16,8 +16,7 @@ def inspect_data():
             rows = cursor.fetchall()
             if rows:
                 print(f"Found {len(rows)} students with Major data:")
-                for row in rows:
-                    print(row)
+                print("\n".join(map(str, rows)))
             else:
                 print("No students in view have Major data!")
     except Exception as e:
@@ -24,8 +24,8 @@ def test_history():
         with db_cursor() as cursor:
             cursor.execute(query)
             rows = cursor.fetchall()
-            for row in rows:
-                print(row)
+            if rows:
+                print("\n".join(map(str, rows)))
     except Exception as e:
         print(f"Error inspecting ClassId: {e}")
 
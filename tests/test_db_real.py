@@ -1,30 +1,34 @@
 import pymssql
+import pytest
 import os
 from dotenv import load_dotenv
 
 load_dotenv()
 
+HOST = os.getenv("LEGACY_DB_HOST", "96.9.90.64")
+PORT = os.getenv("LEGACY_DB_PORT", "1500")
+USER = os.getenv("LEGACY_DB_USER", "sa")
+PASSWORD = os.getenv("LEGACY_DB_PASSWORD", "123456")
+DBNAME = os.getenv("LEGACY_DB_NAME", "New_PUCDB")
 
-def test_connection():
-    host = os.getenv("LEGACY_DB_HOST", "96.9.90.64")
-    port = os.getenv("LEGACY_DB_PORT", "1500")
-    user = os.getenv("LEGACY_DB_USER", "sa")
-    password = os.getenv("LEGACY_DB_PASSWORD", "123456")
-    dbname = os.getenv("LEGACY_DB_NAME", "New_PUCDB")
+# freetds.conf at the repository root, independent of the working directory
+FREETDS_CONF_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), os.pardir, "freetds.conf"
+)
 
-    # Point to local freetds.conf
-    freetds_conf_path = os.path.abspath("freetds.conf")
-    os.environ["FREETDSCONF"] = freetds_conf_path
-    print(f"Using FREETDSCONF: {freetds_conf_path}")
 
-    print(f"Attempting to connect to {host}:{port} as {user}...")
+def test_connection(monkeypatch):
+    monkeypatch.setenv("FREETDSCONF", FREETDS_CONF_PATH)
+    print(f"Using FREETDSCONF: {FREETDS_CONF_PATH}")
+
+    print(f"Attempting to connect to {HOST}:{PORT} as {USER}...")
 
     try:
         conn = pymssql.connect(
-            server=f"{host}:{port}",
-            user=user,
-            password=password,
-            database=dbname,
+            server=f"{HOST}:{PORT}",
+            user=USER,
+            password=PASSWORD,
+            database=DBNAME,
             timeout=10,
             login_timeout=10,
             tds_version="7.3",
@@ -44,4 +48,5 @@ def test_connection():
 
 
 if __name__ == "__main__":
-    test_connection()
+    with pytest.MonkeyPatch.context() as mp:
+        test_connection(mp)
@@ -8,6 +8,9 @@ Validates the 15 prerequisite chains (a-o) and ensures:
 - Students only see immediately next course, not courses further ahead
 """
 
+import sys
+
+import pandas as pd
 import pytest
 from logic.prerequisites import (
     load_prerequisites,
@@ -15,20 +18,26 @@ from logic.prerequisites import (
     is_course_eligible,
     is_next_in_chain,
     get_eligible_courses,
+    filter_student_requirements,
+    get_major_courses,
 )
 
+# Chains that the multi-chain courses belong to
+_ARIL_CHAINS = frozenset('bcde')
+_MATH_CHAINS = frozenset('mn')
+
 
 # ============================================================================
 # Fixtures - Mock prerequisite data matching real CSV structure
 # ============================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def prereq_data():
     """Load actual prerequisite data from CSV."""
     return load_prerequisites()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_prereq_data():
     """
     Mock prerequisite data matching the 15 chains (a-o).
@@ -88,6 +97,24 @@ def mock_prereq_data():
     }
 
 
+@pytest.fixture(scope="module")
+def mock_requirements_df():
+    """Mock requirements DataFrame matching curriculum_requirements2.csv structure."""
+    return pd.DataFrame({
+        'course_code': [
+            'ACCT-310', 'ACCT-312', 'ACCT-313', 'ACCT-300',  # Chain a
+            'ARIL-210', 'ENGL-201A',  # Chain b
+            'ECON-101', 'ECON-211',  # Chain f
+            'BUS-101', 'COMP-150',  # No prerequisites
+        ],
+        'BAD': ['X', 'X', 'X', 'X', 'X', 'X', '', '', 'X', ''],
+        'THM': ['', '', '', '', 'X', 'X', 'X', 'X', '', 'X'],
+        'FIN': ['X', 'X', '', '', '', '', 'X', 'X', 'X', ''],
+        'TES': ['', '', '', '', 'X', 'X', '', '', '', 'X'],
+        'INT': ['X', '', '', '', '', '', '', '', 'X', 'X'],
+    })
+
+
 # ============================================================================
 # Test: CSV Loading
 # ============================================================================
@@ -104,37 +131,60 @@ class TestLoadPrerequisites:
     def test_chain_a_accounting_sequence(self, prereq_data):
         """Chain a: ACCT-310 → ACCT-312 → ACCT-313 → ACCT-300"""
         chain_a = prereq_data['chains']['a']
-        assert chain_a == [
+        assert chain_a == (
             (1, 'ACCT-310'),
             (2, 'ACCT-312'),
             (3, 'ACCT-313'),
             (4, 'ACCT-300'),
-        ]
+        )
 
     def test_chain_f_economics_sequence(self, prereq_data):
         """Chain f: ECON-101 → ECON-211 → ECON-212"""
         chain_f = prereq_data['chains']['f']
-        assert chain_f == [
+        assert chain_f == (
             (1, 'ECON-101'),
             (2, 'ECON-211'),
             (3, 'ECON-212'),
-        ]
+        )
 
     def test_chain_h_english_sequence(self, prereq_data):
         """Chain h: ENGL-110 → ENGL-120"""
         chain_h = prereq_data['chains']['h']
-        assert chain_h == [
+        assert chain_h == (
             (1, 'ENGL-110'),
             (2, 'ENGL-120'),
-        ]
+        )
+
+    def test_chain_orders_index(self, prereq_data):
+        """chain_orders maps each chain's courses to their order."""
+        assert prereq_data['chain_orders']['a'] == {
+            'ACCT-310': 1,
+            'ACCT-312': 2,
+            'ACCT-313': 3,
+            'ACCT-300': 4,
+        }
+        assert get_chain_progress('a', ['ACCT-310', 'ACCT-312'], prereq_data) == 2
+
+    def test_course_prereqs_sets(self, prereq_data):
+        """course_prereqs holds the prior courses for each chain a course is in."""
+        assert prereq_data['course_prereqs']['ACCT-313'] == (
+            frozenset({'ACCT-310', 'ACCT-312'}),
+        )
+        # Identical sets from its four chains collapse into one check
+        assert prereq_data['course_prereqs']['ARIL-210'] == (frozenset(),)
+
+    def test_loaded_codes_are_interned(self, prereq_data):
+        """Course codes loaded from the CSV are interned."""
+        _, code = prereq_data['chains']['a'][0]
+        assert code is sys.intern('ACCT-310')
 
     def test_aril210_in_four_chains(self, prereq_data):
         """ARIL-210 should appear in chains b, c, d, e (all at order 1)."""
         course_to_chains = prereq_data['course_to_chains']
         aril_chains = course_to_chains.get('ARIL-210', [])
 
-        chain_ids = {chain_id for chain_id, order in aril_chains}
-        assert chain_ids == {'b', 'c', 'd', 'e'}, f"ARIL-210 chains: {chain_ids}"
+        chain_ids = frozenset(chain_id for chain_id, order in aril_chains)
+        assert chain_ids == _ARIL_CHAINS, f"ARIL-210 chains: {chain_ids}"
 
         # All should be order 1
         for chain_id, order in aril_chains:
@@ -145,8 +195,8 @@ class TestLoadPrerequisites:
         course_to_chains = prereq_data['course_to_chains']
         math_chains = course_to_chains.get('MATH-101', [])
 
-        chain_ids = {chain_id for chain_id, order in math_chains}
-        assert chain_ids == {'m', 'n'}, f"MATH-101 chains: {chain_ids}"
+        chain_ids = frozenset(chain_id for chain_id, order in math_chains)
+        assert chain_ids == _MATH_CHAINS, f"MATH-101 chains: {chain_ids}"
 
 
 # ============================================================================
@@ -371,6 +421,18 @@ class TestGetEligibleCourses:
         assert 'ACCT-313' not in eligible
         assert 'ACCT-300' not in eligible
 
+    @pytest.mark.parametrize('container', [list, set, frozenset])
+    def test_accepts_any_taken_collection(self, mock_prereq_data, container):
+        """Courses taken may be passed as a list, set or frozenset."""
+        all_required = ['ACCT-310', 'ACCT-312', 'ACCT-313', 'ARIL-210', 'SOC-429']
+        courses_taken = container(['ACCT-310', 'ARIL-210'])
+
+        eligible = get_eligible_courses(courses_taken, all_required, mock_prereq_data)
+
+        assert eligible == ['ACCT-312', 'SOC-429']
+        assert is_course_eligible('ACCT-312', courses_taken, mock_prereq_data)
+        assert not is_course_eligible('ACCT-313', courses_taken, mock_prereq_data)
+
     def test_courses_not_in_chains_always_eligible(self, mock_prereq_data):
         """Courses without prerequisites are always eligible."""
         all_required = ['ACCT-310', 'BUS-101', 'COMP-150']
@@ -429,28 +491,17 @@ class TestGetEligibleCourses:
 class TestFilterStudentRequirements:
     """Tests for filter_student_requirements function - the main entry point."""
 
-    @pytest.fixture
-    def mock_requirements_df(self):
-        """Mock requirements DataFrame matching curriculum_requirements2.csv structure."""
-        import pandas as pd
-        return pd.DataFrame({
-            'course_code': [
-                'ACCT-310', 'ACCT-312', 'ACCT-313', 'ACCT-300',  # Chain a
-                'ARIL-210', 'ENGL-201A',  # Chain b
-                'ECON-101', 'ECON-211',  # Chain f
-                'BUS-101', 'COMP-150',  # No prerequisites
-            ],
-            'BAD': ['X', 'X', 'X', 'X', 'X', 'X', '', '', 'X', ''],
-            'THM': ['', '', '', '', 'X', 'X', 'X', 'X', '', 'X'],
-            'FIN': ['X', 'X', '', '', '', '', 'X', 'X', 'X', ''],
-            'TES': ['', '', '', '', 'X', 'X', '', '', '', 'X'],
-            'INT': ['X', '', '', '', '', '', '', '', 'X', 'X'],
-        })
+    def test_major_index_follows_requirements_df(self, mock_requirements_df):
+        """The major index is reused for one DataFrame and rebuilt for another."""
+        assert get_major_courses(mock_requirements_df, 'TES') == ('ARIL-210', 'ENGL-201A', 'COMP-150')
+        assert get_major_courses(mock_requirements_df, 'XYZ') == ()
+
+        reloaded = mock_requirements_df.copy()
+        reloaded.loc[reloaded['course_code'] == 'COMP-150', 'TES'] = ''
+        assert get_major_courses(reloaded, 'TES') == ('ARIL-210', 'ENGL-201A')
 
     def test_bad_major_new_student(self, mock_prereq_data, mock_requirements_df):
         """BAD major new student sees only first courses + no-prereq courses."""
-        from logic.prerequisites import filter_student_requirements
-
         eligible = filter_student_requirements(
             student_id='12345',
             major_code='BAD-50',
@@ -470,8 +521,6 @@ class TestFilterStudentRequirements:
 
     def test_bad_major_with_progress(self, mock_prereq_data, mock_requirements_df):
         """BAD major student with some progress sees correct next courses."""
-        from logic.prerequisites import filter_student_requirements
-
         eligible = filter_student_requirements(
             student_id='12345',
             major_code='BAD-50',
@@ -492,8 +541,6 @@ class TestFilterStudentRequirements:
 
     def test_thm_major_student(self, mock_prereq_data, mock_requirements_df):
         """THM major student sees THM-required courses filtered by prerequisites."""
-        from logic.prerequisites import filter_student_requirements
-
         eligible = filter_student_requirements(
             student_id='12345',
             major_code='THM-53E',
@@ -514,8 +561,6 @@ class TestFilterStudentRequirements:
 
     def test_invalid_major_returns_empty(self, mock_prereq_data, mock_requirements_df):
         """Invalid major code returns empty list."""
-        from logic.prerequisites import filter_student_requirements
-
         eligible = filter_student_requirements(
             student_id='12345',
             major_code='INVALID-99',
@@ -528,9 +573,6 @@ class TestFilterStudentRequirements:
 
     def test_empty_requirements_df(self, mock_prereq_data):
         """Empty requirements DataFrame returns empty list."""
-        import pandas as pd
-        from logic.prerequisites import filter_student_requirements
-
         eligible = filter_student_requirements(
             student_id='12345',
             major_code='BAD-50',
@@ -543,8 +585,6 @@ class TestFilterStudentRequirements:
 
     def test_all_courses_taken(self, mock_prereq_data, mock_requirements_df):
         """Student who completed all requirements gets empty list."""
-        from logic.prerequisites import filter_student_requirements
-
         all_taken = ['ACCT-310', 'ACCT-312', 'ACCT-313', 'ACCT-300',
                      'ARIL-210', 'ENGL-201A', 'BUS-101']
 